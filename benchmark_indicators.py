@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the native indicator kernels against the stockstats path.
+
+Usage:
+    python benchmark_indicators.py            # synthetic 10-year price series
+    python benchmark_indicators.py NVDA       # offline YFin CSV from the data dir
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tradingagents.dataflows.config import DATA_DIR
+from tradingagents.dataflows.indicators import IndicatorEngine, NATIVE_INDICATORS
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+
+def synthetic_prices(rows=2600, seed=0):
+    """Random-walk OHLCV frame shaped like the offline YFin CSVs."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=rows))
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2015-01-02", periods=rows).strftime("%Y-%m-%d"),
+            "Open": close + rng.random(rows),
+            "High": close + 1 + rng.random(rows),
+            "Low": close - 1 - rng.random(rows),
+            "Close": close,
+            "Volume": rng.integers(100_000, 10_000_000, rows),
+        }
+    )
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_stockstats(data):
+    # the StockstatsUtils path wraps a fresh frame for every indicator request
+    return {ind: wrap(data.copy())[ind].to_numpy() for ind in NATIVE_INDICATORS}
+
+
+def run_native_each(data):
+    return {
+        ind: IndicatorEngine.from_frame(data).get(ind) for ind in NATIVE_INDICATORS
+    }
+
+
+def run_native_bulk(data):
+    return IndicatorEngine.from_frame(data).compute(NATIVE_INDICATORS)
+
+
+def main():
+    if len(sys.argv) > 1:
+        symbol = sys.argv[1]
+        data = StockstatsUtils.get_stock_data(
+            symbol, str(Path(DATA_DIR) / "market_data" / "price_data")
+        )
+        label = f"{symbol} ({len(data)} rows)"
+    else:
+        data = synthetic_prices()
+        label = f"synthetic ({len(data)} rows)"
+
+    print("📐 Indicator Benchmark")
+    print("=" * 50)
+    print(f"Data: {label}")
+    print(f"Indicators: {', '.join(NATIVE_INDICATORS)}")
+
+    reference = run_stockstats(data)
+    native = run_native_bulk(data)
+    print("\n🔍 Max abs difference vs stockstats:")
+    for ind in NATIVE_INDICATORS:
+        diff = np.nanmax(np.abs(reference[ind].astype(float) - native[ind]))
+        match = np.allclose(
+            reference[ind].astype(float), native[ind], rtol=1e-9, atol=1e-9, equal_nan=True
+        )
+        print(f"  {ind:<14} {diff:.3e} {'✅' if match else '❌'}")
+
+    stockstats_time = best_of(lambda: run_stockstats(data))
+    each_time = best_of(lambda: run_native_each(data))
+    bulk_time = best_of(lambda: run_native_bulk(data))
+
+    print("\n⏱️  Time for all indicators (best of 5):")
+    print(f"  stockstats (wrap per indicator): {stockstats_time * 1000:8.2f} ms")
+    print(
+        f"  native (engine per indicator):   {each_time * 1000:8.2f} ms"
+        f"  ({stockstats_time / each_time:.1f}x)"
+    )
+    print(
+        f"  native (one bulk pass):          {bulk_time * 1000:8.2f} ms"
+        f"  ({stockstats_time / bulk_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
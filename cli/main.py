@@ -34,6 +34,10 @@ app = typer.Typer(
 )
 
 
+# Graph nodes shown under a different agent name
+NODE_AGENTS = {"Risk Judge": "Portfolio Manager"}
+
+
 # Create a deque to store recent messages with a maximum length
 class MessageBuffer:
     def __init__(self, max_length=100):
@@ -61,6 +65,7 @@ class MessageBuffer:
             "Portfolio Manager": "pending",
         }
         self.current_agent = None
+        self.streaming = {}  # node -> (start timestamp, text streamed so far)
         self.report_sections = {
             "market_report": None,
             "sentiment_report": None,
@@ -79,6 +84,18 @@ class MessageBuffer:
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         self.tool_calls.append((timestamp, tool_name, args))
 
+    def add_token(self, node, token):
+        """Append a token delta to the node's in-progress message."""
+        timestamp, text = self.streaming.get(
+            node, (datetime.datetime.now().strftime("%H:%M:%S"), "")
+        )
+        self.streaming[node] = (timestamp, text + token)
+        self.update_agent_status(NODE_AGENTS.get(node, node), "in_progress")
+
+    def finish_stream(self, node):
+        """Drop the node's in-progress message once its full update has arrived."""
+        self.streaming.pop(node, None)
+
     def update_agent_status(self, agent, status):
         if agent in self.agent_status:
             self.agent_status[agent] = status
@@ -319,6 +336,13 @@ def update_display(layout, spinner_text=None):
             content_str = content_str[:197] + "..."
         all_messages.append((timestamp, msg_type, content_str))
 
+    # Add messages still being streamed, showing their latest tokens
+    for node, (timestamp, text) in message_buffer.streaming.items():
+        text = text.replace("\n", " ")
+        if len(text) > 180:
+            text = "..." + text[-177:]
+        all_messages.append((timestamp, "Streaming", f"{node}: {text}"))
+
     # Sort by timestamp
     all_messages.sort(key=lambda x: x[0])
 
@@ -743,6 +767,8 @@ def run_analysis():
     config["deep_think_llm"] = selections["deep_thinker"]
     config["backend_url"] = selections["backend_url"]
     config["llm_provider"] = selections["llm_provider"].lower()
+    # The live display only shows reports produced in this session, so always start afresh
+    config["resume_runs"] = False
 
     # Initialize the graph
     graph = TradingAgentsGraph(
@@ -835,46 +861,61 @@ def run_analysis():
         )
         update_display(layout, spinner_text)
 
-        # Initialize state and get graph args
-        init_agent_state = graph.propagator.create_initial_state(
-            selections["ticker"], selections["analysis_date"]
-        )
-        args = graph.propagator.get_graph_args()
-
-        # Stream the analysis
-        trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
-            if len(chunk["messages"]) > 0:
-                # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
-
-                # Extract message content and type
-                if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)  # Use the helper function
-                    msg_type = "Reasoning"
-                else:
-                    content = str(last_message)
-                    msg_type = "System"
-
-                # Add message to buffer
-                message_buffer.add_message(msg_type, content)                
-
-                # If it's a tool call, add it to tool calls
-                if hasattr(last_message, "tool_calls"):
-                    for tool_call in last_message.tool_calls:
-                        # Handle both dictionary and object tool calls
-                        if isinstance(tool_call, dict):
-                            message_buffer.add_tool_call(
-                                tool_call["name"], tool_call["args"]
-                            )
-                        else:
-                            message_buffer.add_tool_call(tool_call.name, tool_call.args)
+        # Stream token deltas and per-node updates rather than whole-state copies
+        last_redraw = 0.0
+        final_state = None
+        for mode, chunk in graph.stream(selections["ticker"], selections["analysis_date"]):
+            if mode == "values":
+                final_state = chunk
+                continue
 
-                # Update reports and agent status based on chunk content
+            if mode == "messages":
+                message_chunk, metadata = chunk
+                token = extract_content_string(message_chunk.content)
+                if token:
+                    message_buffer.add_token(metadata.get("langgraph_node", ""), token)
+                    # Tokens arrive far faster than the screen refreshes, so throttle redraws
+                    if time.monotonic() - last_redraw > 0.25:
+                        update_display(layout, spinner_text)
+                        last_redraw = time.monotonic()
+                continue
+
+            for node, update in chunk.items():
+                message_buffer.finish_stream(node)
+                if not isinstance(update, dict):
+                    continue
+
+                if update.get("messages"):
+                    # Get the last message from the update
+                    last_message = update["messages"][-1]
+
+                    # Extract message content and type
+                    if hasattr(last_message, "content"):
+                        content = extract_content_string(last_message.content)  # Use the helper function
+                        msg_type = "Reasoning"
+                    else:
+                        content = str(last_message)
+                        msg_type = "System"
+
+                    # Add message to buffer
+                    message_buffer.add_message(msg_type, content)                
+
+                    # If it's a tool call, add it to tool calls
+                    if hasattr(last_message, "tool_calls"):
+                        for tool_call in last_message.tool_calls:
+                            # Handle both dictionary and object tool calls
+                            if isinstance(tool_call, dict):
+                                message_buffer.add_tool_call(
+                                    tool_call["name"], tool_call["args"]
+                                )
+                            else:
+                                message_buffer.add_tool_call(tool_call.name, tool_call.args)
+
+                # Update reports and agent status based on the node's update
                 # Analyst Team Reports
-                if "market_report" in chunk and chunk["market_report"]:
+                if "market_report" in update and update["market_report"]:
                     message_buffer.update_report_section(
-                        "market_report", chunk["market_report"]
+                        "market_report", update["market_report"]
                     )
                     message_buffer.update_agent_status("Market Analyst", "completed")
                     # Set next analyst to in_progress
@@ -883,9 +924,9 @@ def run_analysis():
                             "Social Analyst", "in_progress"
                         )
 
-                if "sentiment_report" in chunk and chunk["sentiment_report"]:
+                if "sentiment_report" in update and update["sentiment_report"]:
                     message_buffer.update_report_section(
-                        "sentiment_report", chunk["sentiment_report"]
+                        "sentiment_report", update["sentiment_report"]
                     )
                     message_buffer.update_agent_status("Social Analyst", "completed")
                     # Set next analyst to in_progress
@@ -894,9 +935,9 @@ def run_analysis():
                             "News Analyst", "in_progress"
                         )
 
-                if "news_report" in chunk and chunk["news_report"]:
+                if "news_report" in update and update["news_report"]:
                     message_buffer.update_report_section(
-                        "news_report", chunk["news_report"]
+                        "news_report", update["news_report"]
                     )
                     message_buffer.update_agent_status("News Analyst", "completed")
                     # Set next analyst to in_progress
@@ -905,9 +946,9 @@ def run_analysis():
                             "Fundamentals Analyst", "in_progress"
                         )
 
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"]:
+                if "fundamentals_report" in update and update["fundamentals_report"]:
                     message_buffer.update_report_section(
-                        "fundamentals_report", chunk["fundamentals_report"]
+                        "fundamentals_report", update["fundamentals_report"]
                     )
                     message_buffer.update_agent_status(
                         "Fundamentals Analyst", "completed"
@@ -917,10 +958,10 @@ def run_analysis():
 
                 # Research Team - Handle Investment Debate State
                 if (
-                    "investment_debate_state" in chunk
-                    and chunk["investment_debate_state"]
+                    "investment_debate_state" in update
+                    and update["investment_debate_state"]
                 ):
-                    debate_state = chunk["investment_debate_state"]
+                    debate_state = update["investment_debate_state"]
 
                     # Update Bull Researcher status and report
                     if "bull_history" in debate_state and debate_state["bull_history"]:
@@ -977,18 +1018,18 @@ def run_analysis():
 
                 # Trading Team
                 if (
-                    "trader_investment_plan" in chunk
-                    and chunk["trader_investment_plan"]
+                    "trader_investment_plan" in update
+                    and update["trader_investment_plan"]
                 ):
                     message_buffer.update_report_section(
-                        "trader_investment_plan", chunk["trader_investment_plan"]
+                        "trader_investment_plan", update["trader_investment_plan"]
                     )
                     # Set first risk analyst to in_progress
                     message_buffer.update_agent_status("Risky Analyst", "in_progress")
 
                 # Risk Management Team - Handle Risk Debate State
-                if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                    risk_state = chunk["risk_debate_state"]
+                if "risk_debate_state" in update and update["risk_debate_state"]:
+                    risk_state = update["risk_debate_state"]
 
                     # Update Risky Analyst status and report
                     if (
@@ -1068,14 +1109,13 @@ def run_analysis():
                             "Portfolio Manager", "completed"
                         )
 
-                # Update the display
-                update_display(layout)
-
-            trace.append(chunk)
+            # Update the display
+            update_display(layout)
 
-        # Get final state and decision
-        final_state = trace[-1]
-        decision = graph.process_signal(final_state["final_trade_decision"])
+        # Get final decision
+        decision = graph.process_signal(
+            final_state["final_trade_decision"], selections["ticker"]
+        )
 
         # Update all agent statuses to completed
         for agent in message_buffer.agent_status:
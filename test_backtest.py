@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Tests for scoring backtest decisions without touching the saved wallet.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tradingagents.agents.utils.wallet import TradingWallet
+from tradingagents.graph.backtest import Backtester
+
+
+def test_backtest_position_return():
+    """Decisions with quantities score the position they take."""
+
+    # A rising close is a gain for a BUY and a loss for a SELL
+    assert Backtester.position_return("BUY 10 AAPL", 0.05) > 0
+    assert Backtester.position_return("SELL 5 NVDA", 0.05) < 0
+    assert Backtester.position_return("HOLD", 0.05) == 0.0
+
+
+def test_in_memory_wallet_stays_off_disk():
+    """The wallet a backtest runs against is never loaded from or saved to disk."""
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            wallet = TradingWallet(initial_cash_usd=1000.0, wallet_file=None)
+            wallet.reset_wallet(initial_cash_usd=2000.0)
+            assert wallet.state.cash_usd == 2000.0
+            assert os.listdir(tmp_dir) == []
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_backtest_position_return()
+    test_in_memory_wallet_stays_off_disk()
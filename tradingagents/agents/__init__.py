@@ -1,6 +1,8 @@
 from .utils.agent_utils import Toolkit, create_msg_delete
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
 from .utils.memory import FinancialSituationMemory
+from .utils.debate_memory import DebateMemory
+from .utils.prompt_layout import PromptLayout
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -21,6 +23,8 @@ from .trader.trader import create_trader
 
 __all__ = [
     "FinancialSituationMemory",
+    "DebateMemory",
+    "PromptLayout",
     "Toolkit",
     "AgentState",
     "create_msg_delete",
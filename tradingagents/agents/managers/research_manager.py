@@ -2,7 +2,7 @@ import time
 import json
 
 
-def create_research_manager(llm, memory):
+def create_research_manager(llm, memory, layout):
     def research_manager_node(state) -> dict:
         history = state["investment_debate_state"].get("history", "")
         market_research_report = state["market_report"]
@@ -19,7 +19,7 @@ def create_research_manager(llm, memory):
         for i, rec in enumerate(past_memories, 1):
             past_memory_str += rec["recommendation"] + "\n\n"
 
-        prompt = f"""As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
+        static = """As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
 
 Summarize the key points from both sides concisely, focusing on the most compelling evidence or reasoning. Your recommendation—Buy, Sell, or Hold—must be clear and actionable. Avoid defaulting to Hold simply because both sides have valid points; commit to a stance grounded in the debate's strongest arguments.
 
@@ -28,15 +28,15 @@ Additionally, develop a detailed investment plan for the trader. This should inc
 Your Recommendation: A decisive stance supported by the most convincing arguments.
 Rationale: An explanation of why these arguments lead to your conclusion.
 Strategic Actions: Concrete steps for implementing the recommendation.
-Take into account your past mistakes on similar situations. Use these insights to refine your decision-making and ensure you are learning and improving. Present your analysis conversationally, as if speaking naturally, without special formatting. 
+Take into account your past mistakes on similar situations. Use these insights to refine your decision-making and ensure you are learning and improving. Present your analysis conversationally, as if speaking naturally, without special formatting."""
 
-Here are your past reflections on mistakes:
+        volatile = f"""Here are your past reflections on mistakes:
 \"{past_memory_str}\"
 
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        response = llm.invoke(layout.prompt(static, volatile))
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -45,6 +45,9 @@ Debate History:
             "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": response.content,
             "count": investment_debate_state["count"],
+            "turns": investment_debate_state.get("turns", []),
+            "summary": investment_debate_state.get("summary", ""),
+            "summarized_turns": investment_debate_state.get("summarized_turns", 0),
         }
 
         return {
@@ -2,7 +2,7 @@ import time
 import json
 
 
-def create_risk_manager(llm, memory):
+def create_risk_manager(llm, memory, layout):
     def risk_manager_node(state) -> dict:
 
         company_name = state["company_of_interest"]
@@ -11,7 +11,7 @@ def create_risk_manager(llm, memory):
         risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
+        fundamentals_report = state["fundamentals_report"]
         sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
         
@@ -29,6 +29,8 @@ def create_risk_manager(llm, memory):
         # Check if we're analyzing crypto and adjust the prompt accordingly
         is_crypto = company_name.endswith('-USD') or company_name.endswith('-USDT') or company_name in ['BTC', 'ETH', 'ADA', 'SOL', 'AVAX', 'DOT', 'MATIC', 'LINK', 'UNI', 'AAVE']
         
+        symbol = company_name.replace('-USD', '') if is_crypto else company_name
+
         if is_crypto:
             decision_format = f"""
 🎯 **REQUIRED DECISION FORMAT:**
@@ -69,9 +71,7 @@ Consider stock-specific factors:
 - Market hours and liquidity considerations
 """
 
-        prompt = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation with EXACT QUANTITIES: Buy (with specific amount), Sell (with specific amount), or Hold. 
-
-{wallet_context}
+        static = f"""As the Risk Management Judge and Debate Facilitator, your goal is to evaluate the debate between three risk analysts—Risky, Neutral, and Safe/Conservative—and determine the best course of action for the trader. Your decision must result in a clear recommendation with EXACT QUANTITIES: Buy (with specific amount), Sell (with specific amount), or Hold. 
 
 {decision_format}
 
@@ -81,25 +81,33 @@ Guidelines for Decision-Making:
 3. **Determine Position Size**: Calculate appropriate quantity based on portfolio allocation
 4. **Summarize Key Arguments**: Extract the strongest points from each analyst
 5. **Provide Rationale**: Support your recommendation with specific reasoning
-6. **Refine the Trader's Plan**: Start with the trader's original plan, **{trader_plan}**, and adjust quantities based on the analysts' insights and wallet constraints
+6. **Refine the Trader's Plan**: Start with the trader's original plan below and adjust quantities based on the analysts' insights and wallet constraints
 
-**Learn from Past Mistakes**: Use lessons from **{past_memory_str}** to address prior misjudgments and improve the decision you are making now to make sure you don't make a wrong trading call that loses money.
+**Learn from Past Mistakes**: Use the lessons below to address prior misjudgments and improve the decision you are making now to make sure you don't make a wrong trading call that loses money.
 
 Deliverables:
 - A clear and actionable recommendation with exact quantities
 - Detailed reasoning anchored in the debate and portfolio analysis
 - Risk assessment and position sizing justification
 
----
+Focus on actionable insights with specific quantities, continuous improvement, and portfolio-appropriate position sizing. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes while managing risk appropriately.
 
-**Analysts Debate History:**  
-{history}
+End your response with the decision block on a line of its own, with nothing after it:
+FINAL DECISION: {{"action": "BUY", "quantity": 10, "symbol": "{symbol}"}}
+"action" is "BUY", "SELL" or "HOLD", "quantity" is the exact amount to trade as a number (null for HOLD) and "symbol" is "{symbol}"."""
+
+        volatile = f"""{wallet_context}
+
+**Trader's Original Plan:** {trader_plan}
+
+**Lessons from Past Mistakes:** {past_memory_str}
 
 ---
 
-Focus on actionable insights with specific quantities, continuous improvement, and portfolio-appropriate position sizing. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes while managing risk appropriately."""
+**Analysts Debate History:**  
+{history}"""
 
-        response = llm.invoke(prompt)
+        response = llm.invoke(layout.prompt(static, volatile))
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -112,6 +120,9 @@ Focus on actionable insights with specific quantities, continuous improvement, a
             "current_safe_response": risk_debate_state["current_safe_response"],
             "current_neutral_response": risk_debate_state["current_neutral_response"],
             "count": risk_debate_state["count"],
+            "turns": risk_debate_state.get("turns", []),
+            "summary": risk_debate_state.get("summary", ""),
+            "summarized_turns": risk_debate_state.get("summarized_turns", 0),
         }
 
         return {
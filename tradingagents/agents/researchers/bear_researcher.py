@@ -3,10 +3,11 @@ import time
 import json
 
 
-def create_bear_researcher(llm, memory):
+def create_bear_researcher(llm, memory, debate_memory, layout):
     def bear_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
+        debate_context = debate_memory.context(investment_debate_state)
         bear_history = investment_debate_state.get("bear_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
@@ -27,7 +28,7 @@ def create_bear_researcher(llm, memory):
         is_crypto = company_name.endswith('-USD') or company_name.endswith('-USDT') or company_name in ['BTC', 'ETH', 'ADA', 'SOL', 'AVAX', 'DOT', 'MATIC', 'LINK', 'UNI', 'AAVE']
         
         if is_crypto:
-            prompt = f"""You are a Crypto Bear Analyst making the case against investing in this cryptocurrency. Your goal is to present a well-reasoned argument emphasizing risks, challenges, and negative indicators specific to crypto markets.
+            static = f"""You are a Crypto Bear Analyst making the case against investing in this cryptocurrency. Your goal is to present a well-reasoned argument emphasizing risks, challenges, and negative indicators specific to crypto markets.
 
 Key points to focus on for crypto analysis:
 - Market Risks: Extreme volatility, regulatory uncertainty, market manipulation, liquidity issues
@@ -38,19 +39,13 @@ Key points to focus on for crypto analysis:
 - Macro Factors: Interest rate impacts, economic downturns, risk-off sentiment affecting crypto
 - Crypto-Specific Risks: Exchange risks, wallet security, smart contract vulnerabilities, DeFi risks
 
+Use the resources below to deliver a compelling bear argument against the cryptocurrency, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in crypto.
+
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest crypto and blockchain news: {news_report}
-Cryptocurrency fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
-Last bull argument: {current_response}
-Reflections from similar crypto situations and lessons learned: {past_memory_str}
-
-Use this information to deliver a compelling bear argument against the cryptocurrency, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in crypto.
-"""
+{layout.reports(state, layout.CRYPTO_REPORT_LABELS)}
+Reflections from similar crypto situations and lessons learned: {past_memory_str}"""
         else:
-            prompt = f"""You are a Bear Analyst making the case against investing in the stock. Your goal is to present a well-reasoned argument emphasizing risks, challenges, and negative indicators. Leverage the provided research and data to highlight potential downsides and counter bullish arguments effectively.
+            static = f"""You are a Bear Analyst making the case against investing in the stock. Your goal is to present a well-reasoned argument emphasizing risks, challenges, and negative indicators. Leverage the provided research and data to highlight potential downsides and counter bullish arguments effectively.
 
 Key points to focus on:
 
@@ -60,19 +55,16 @@ Key points to focus on:
 - Bull Counterpoints: Critically analyze the bull argument with specific data and sound reasoning, exposing weaknesses or over-optimistic assumptions.
 - Engagement: Present your argument in a conversational style, directly engaging with the bull analyst's points and debating effectively rather than simply listing facts.
 
+Use the resources below to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
+
 Resources available:
+{layout.reports(state)}
+Reflections from similar situations and lessons learned: {past_memory_str}"""
 
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
-Last bull argument: {current_response}
-Reflections from similar situations and lessons learned: {past_memory_str}
-Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
-"""
+        volatile = f"""Conversation history of the debate: {debate_context}
+Last bull argument: {current_response}"""
 
-        response = llm.invoke(prompt)
+        response = llm.invoke(layout.prompt(static, volatile))
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -82,6 +74,7 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
             "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
+            **debate_memory.record(investment_debate_state, argument),
         }
 
         return {"investment_debate_state": new_investment_debate_state}
@@ -3,10 +3,11 @@ import time
 import json
 
 
-def create_bull_researcher(llm, memory):
+def create_bull_researcher(llm, memory, debate_memory, layout):
     def bull_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
+        debate_context = debate_memory.context(investment_debate_state)
         bull_history = investment_debate_state.get("bull_history", "")
         current_response = investment_debate_state.get("current_response", "")
         
@@ -27,7 +28,7 @@ def create_bull_researcher(llm, memory):
         is_crypto = company_name.endswith('-USD') or company_name.endswith('-USDT') or company_name in ['BTC', 'ETH', 'ADA', 'SOL', 'AVAX', 'DOT', 'MATIC', 'LINK', 'UNI', 'AAVE']
         
         if is_crypto:
-            prompt = f"""You are a Crypto Bull Analyst advocating for investing in this cryptocurrency. Your task is to build a strong, evidence-based case emphasizing growth potential, adoption drivers, and positive crypto market indicators.
+            static = f"""You are a Crypto Bull Analyst advocating for investing in this cryptocurrency. Your task is to build a strong, evidence-based case emphasizing growth potential, adoption drivers, and positive crypto market indicators.
 
 Key points to focus on for crypto analysis:
 - Growth Potential: Network growth, adoption metrics, developer activity, ecosystem expansion
@@ -37,19 +38,13 @@ Key points to focus on for crypto analysis:
 - Bear Counterpoints: Address concerns about volatility, regulation, competition with specific data and reasoning
 - Crypto-Specific Factors: DeFi integration, NFT ecosystem, Layer 2 solutions, cross-chain compatibility
 
+Use the resources below to deliver a compelling bull argument for the cryptocurrency, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position.
+
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest crypto and blockchain news: {news_report}
-Cryptocurrency fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
-Last bear argument: {current_response}
-Reflections from similar crypto situations and lessons learned: {past_memory_str}
-
-Use this information to deliver a compelling bull argument for the cryptocurrency, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position.
-"""
+{layout.reports(state, layout.CRYPTO_REPORT_LABELS)}
+Reflections from similar crypto situations and lessons learned: {past_memory_str}"""
         else:
-            prompt = f"""You are a Bull Analyst advocating for investing in the stock. Your task is to build a strong, evidence-based case emphasizing growth potential, competitive advantages, and positive market indicators. Leverage the provided research and data to address concerns and counter bearish arguments effectively.
+            static = f"""You are a Bull Analyst advocating for investing in the stock. Your task is to build a strong, evidence-based case emphasizing growth potential, competitive advantages, and positive market indicators. Leverage the provided research and data to address concerns and counter bearish arguments effectively.
 
 Key points to focus on:
 - Growth Potential: Highlight the company's market opportunities, revenue projections, and scalability.
@@ -58,18 +53,16 @@ Key points to focus on:
 - Bear Counterpoints: Critically analyze the bear argument with specific data and sound reasoning, addressing concerns thoroughly and showing why the bull perspective holds stronger merit.
 - Engagement: Present your argument in a conversational style, engaging directly with the bear analyst's points and debating effectively rather than just listing data.
 
+Use the resources below to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
+
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
-Last bear argument: {current_response}
-Reflections from similar situations and lessons learned: {past_memory_str}
-Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
-"""
-
-        response = llm.invoke(prompt)
+{layout.reports(state)}
+Reflections from similar situations and lessons learned: {past_memory_str}"""
+
+        volatile = f"""Conversation history of the debate: {debate_context}
+Last bear argument: {current_response}"""
+
+        response = llm.invoke(layout.prompt(static, volatile))
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -79,6 +72,7 @@ Use this information to deliver a compelling bull argument, refute the bear's co
             "bear_history": investment_debate_state.get("bear_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
+            **debate_memory.record(investment_debate_state, argument),
         }
 
         return {"investment_debate_state": new_investment_debate_state}
@@ -6,7 +6,7 @@ import json
 from ..utils.crypto_utils import get_crypto_aware_system_message
 
 
-def create_trader(llm, memory):
+def create_trader(llm, memory, layout):
     def trader_node(state, name):
         company_name = state["company_of_interest"]
         investment_plan = state["investment_plan"]
@@ -31,7 +31,7 @@ def create_trader(llm, memory):
 
         context = {
             "role": "user",
-            "content": f"Based on a comprehensive analysis by a team of analysts, here is an investment plan tailored for {company_name}. This plan incorporates insights from current technical market trends, macroeconomic indicators, and social media sentiment. Use this plan as a foundation for evaluating your next trading decision.\n\nProposed Investment Plan: {investment_plan}\n\n{wallet_context}\n\nLeverage these insights to make an informed and strategic decision with specific quantities.",
+            "content": f"Based on a comprehensive analysis by a team of analysts, here is an investment plan tailored for {company_name}. This plan incorporates insights from current technical market trends, macroeconomic indicators, and social media sentiment. Use this plan as a foundation for evaluating your next trading decision.\n\nProposed Investment Plan: {investment_plan}\n\n{wallet_context}\n\nLearn from past trading experiences: {past_memory_str}\n\nLeverage these insights to make an informed and strategic decision with specific quantities.",
         }
 
         # Check if we're analyzing crypto and adjust the system message accordingly
@@ -67,8 +67,6 @@ Examples:
 - "BUY 15 SOL"
 - "HOLD"
 
-Learn from past crypto trading experiences: {past_memory_str}
-
 End with a firm decision and always conclude your response with 'FINAL TRANSACTION PROPOSAL: **[BUY/SELL/HOLD] [QUANTITY] [SYMBOL]**' to confirm your cryptocurrency trading recommendation."""
         else:
             system_content = f"""You are a stock trading agent analyzing market data to make investment decisions. Based on your analysis, provide a specific recommendation with exact quantities to buy, sell, or hold.
@@ -90,17 +88,9 @@ Examples:
 - "BUY 25 TSLA"
 - "HOLD"
 
-Learn from past trading experiences: {past_memory_str}
-
 End with a firm decision and always conclude your response with 'FINAL TRANSACTION PROPOSAL: **[BUY/SELL/HOLD] [QUANTITY] [SYMBOL]**' to confirm your trading recommendation."""
 
-        messages = [
-            {
-                "role": "system",
-                "content": system_content,
-            },
-            context,
-        ]
+        messages = [layout.system(system_content), context]
 
         result = llm.invoke(messages)
 
@@ -20,6 +20,9 @@ class InvestDebateState(TypedDict):
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
+    turns: Annotated[list, "Every argument so far, in order"]
+    summary: Annotated[str, "Rolling summary of the turns no longer shown verbatim"]
+    summarized_turns: Annotated[int, "Number of leading turns folded into the summary"]
 
 
 # Risk management team state
@@ -46,6 +49,9 @@ class RiskDebateState(TypedDict):
     ]  # Last response
     judge_decision: Annotated[str, "Judge's decision"]
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
+    turns: Annotated[list, "Every argument so far, in order"]
+    summary: Annotated[str, "Rolling summary of the turns no longer shown verbatim"]
+    summarized_turns: Annotated[int, "Number of leading turns folded into the summary"]
 
 
 class AgentState(MessagesState):
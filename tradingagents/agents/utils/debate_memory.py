@@ -0,0 +1,73 @@
+from typing import Dict, List
+
+
+class DebateMemory:
+    """
+    Bounded view of a debate for the debaters' prompts: the last `recent_turns`
+    arguments verbatim plus a rolling summary of everything older, kept within
+    `token_budget` (estimated at ~4 characters per token). The full transcript
+    stays in the state's `history` for the judges and the logs.
+    """
+
+    def __init__(self, llm, recent_turns=4, token_budget=4000):
+        self.llm = llm
+        self.recent_turns = max(recent_turns, 1)
+        self.token_budget = token_budget
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return len(text) // 4
+
+    def context(self, debate_state: Dict) -> str:
+        """Debate so far as shown to the next speaker.
+
+        Until turns are summarized this is the same text as the full history.
+        """
+        turns = debate_state.get("turns", [])
+        if not turns:
+            return debate_state.get("history", "")
+
+        recent = "".join(
+            "\n" + turn for turn in turns[debate_state.get("summarized_turns", 0):]
+        )
+        summary = debate_state.get("summary", "")
+        if summary:
+            return f"Summary of the earlier debate: {summary}\n\nMost recent arguments:{recent}"
+        return recent
+
+    def record(self, debate_state: Dict, argument: str) -> Dict:
+        """Add a turn, folding the oldest verbatim turns into the summary as needed.
+
+        Returns the "turns", "summary" and "summarized_turns" fields of the new
+        debate state.
+        """
+        turns = debate_state.get("turns", []) + [argument]
+        summary = debate_state.get("summary", "")
+        summarized = debate_state.get("summarized_turns", 0)
+
+        # Fold turns beyond the window, then more while over budget (never the newest)
+        fold_to = max(summarized, len(turns) - self.recent_turns)
+        while (
+            fold_to < len(turns) - 1
+            and self._estimate(summary, turns[fold_to:]) > self.token_budget
+        ):
+            fold_to += 1
+
+        if fold_to > summarized:
+            summary = self._summarize(summary, turns[summarized:fold_to])
+
+        return {"turns": turns, "summary": summary, "summarized_turns": fold_to}
+
+    def _estimate(self, summary: str, turns: List[str]) -> int:
+        return self.estimate_tokens(summary) + sum(self.estimate_tokens(t) for t in turns)
+
+    def _summarize(self, summary: str, turns: List[str]) -> str:
+        max_words = max(self.token_budget // 4 * 3 // 4, 50)
+        new_arguments = "\n".join(turns)
+        prompt = f"""You keep a running summary of a debate between analysts. Update the summary below with the new arguments. Keep each speaker's key claims, the specific evidence and figures they cite, and the points still in dispute; drop repetition and rhetoric. Attribute claims to speakers. Use at most {max_words} words and output only the summary.
+
+Current summary: {summary or "(none yet)"}
+
+New arguments:
+{new_arguments}"""
+        return self.llm.invoke(prompt).content
@@ -1,7 +1,17 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import chromadb
 from chromadb.config import Settings
 from openai import OpenAI
 
+# Embeddings by (model, sha256 of the text), shared by all memories so the
+# situation of a run is embedded once however many memories query it
+_embedding_cache = OrderedDict()
+_embedding_cache_size = 256
+_lock = threading.Lock()
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -14,12 +24,23 @@ class FinancialSituationMemory:
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
+        """Get OpenAI embedding for a text, reusing it if the same text was embedded before"""
+        key = (self.embedding, hashlib.sha256(text.encode()).hexdigest())
+        with _lock:
+            if key in _embedding_cache:
+                _embedding_cache.move_to_end(key)
+                return _embedding_cache[key]
+
         response = self.client.embeddings.create(
             model=self.embedding, input=text
         )
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
+
+        with _lock:
+            _embedding_cache[key] = embedding
+            while len(_embedding_cache) > _embedding_cache_size:
+                _embedding_cache.popitem(last=False)
+        return embedding
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
@@ -44,13 +65,42 @@ class FinancialSituationMemory:
             ids=ids,
         )
 
+    def snapshot(self):
+        """Get every stored situation with its advice and embedding, for checkpointing"""
+        stored = self.situation_collection.get(
+            include=["documents", "metadatas", "embeddings"]
+        )
+        return {
+            "ids": list(stored["ids"]),
+            "documents": list(stored["documents"]),
+            "metadatas": list(stored["metadatas"]),
+            "embeddings": [list(map(float, e)) for e in stored["embeddings"]],
+        }
+
+    def restore(self, snapshot):
+        """Replace the stored situations with a snapshot, without re-embedding them"""
+        existing = self.situation_collection.get()["ids"]
+        if existing:
+            self.situation_collection.delete(ids=existing)
+        if snapshot["ids"]:
+            self.situation_collection.add(
+                ids=snapshot["ids"],
+                documents=snapshot["documents"],
+                metadatas=snapshot["metadatas"],
+                embeddings=snapshot["embeddings"],
+            )
+
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
+        stored = self.situation_collection.count()
+        if stored == 0:
+            return []
+
         query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
-            n_results=n_matches,
+            n_results=min(n_matches, stored),
             include=["metadatas", "documents", "distances"],
         )
 
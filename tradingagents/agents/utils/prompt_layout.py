@@ -0,0 +1,70 @@
+from typing import Dict, List, Tuple, Union
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+
+class PromptLayout:
+    """
+    Lays prompts out as a static prefix followed by a volatile suffix so that
+    providers with prompt caching can reuse the prefix across calls. The prefix
+    holds what stays fixed for every call of an agent within a run (role
+    instructions, the analyst reports, retrieved memories) and the suffix what
+    changes from call to call (debate history, last responses, the wallet).
+
+    OpenAI and Gemini cache matching prefixes automatically; for Anthropic an
+    explicit cache-control marker is placed at the end of the prefix when
+    `cache_markers` is on.
+    """
+
+    def __init__(self, llm, cache_markers=True):
+        self.llm = llm
+        self.cache_markers = cache_markers and isinstance(llm, ChatAnthropic)
+
+    # Labels the agents have always introduced the four reports with
+    STOCK_REPORT_LABELS = (
+        "Market research report",
+        "Social media sentiment report",
+        "Latest world affairs news",
+        "Company fundamentals report",
+    )
+    CRYPTO_REPORT_LABELS = (
+        "Market research report",
+        "Social media sentiment report",
+        "Latest crypto and blockchain news",
+        "Cryptocurrency fundamentals report",
+    )
+    RISK_REPORT_LABELS = (
+        "Market Research Report",
+        "Social Media Sentiment Report",
+        "Latest World Affairs Report",
+        "Company Fundamentals Report",
+    )
+
+    @staticmethod
+    def reports(state: Dict, labels: Tuple[str, str, str, str] = STOCK_REPORT_LABELS) -> str:
+        """The four analyst reports, unchanged once the analysts have run."""
+        keys = ("market_report", "sentiment_report", "news_report", "fundamentals_report")
+        return "\n".join(f"{label}: {state[key]}" for label, key in zip(labels, keys))
+
+    def _block(self, text: str, cached: bool) -> Dict:
+        block = {"type": "text", "text": text}
+        if cached:
+            block["cache_control"] = {"type": "ephemeral"}
+        return block
+
+    def prompt(self, static: str, volatile: str) -> Union[str, List[BaseMessage]]:
+        """Single-message prompt: the static prefix, then the volatile suffix."""
+        if not self.cache_markers:
+            return f"{static}\n\n{volatile}"
+        return [
+            HumanMessage(
+                content=[self._block(static, True), self._block(f"\n\n{volatile}", False)]
+            )
+        ]
+
+    def system(self, static: str) -> SystemMessage:
+        """System message holding the static prefix of a multi-message prompt."""
+        if not self.cache_markers:
+            return SystemMessage(content=static)
+        return SystemMessage(content=[self._block(static, True)])
@@ -17,7 +17,8 @@ class TradeExecutor:
         """Initialize with a wallet instance."""
         self.wallet = wallet
     
-    def parse_trade_decision(self, decision: str) -> Tuple[str, Optional[float], Optional[str]]:
+    @staticmethod
+    def parse_trade_decision(decision: str) -> Tuple[str, Optional[float], Optional[str]]:
         """
         Parse a trade decision to extract action, quantity, and symbol.
         
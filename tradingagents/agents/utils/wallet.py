@@ -25,13 +25,16 @@ class WalletState:
 class TradingWallet:
     """Manages the trading wallet with cash and cryptocurrency holdings."""
     
-    def __init__(self, initial_cash_usd: float = 50000.0, initial_crypto: Optional[Dict[str, float]] = None):
+    def __init__(self, initial_cash_usd: float = 50000.0, initial_crypto: Optional[Dict[str, float]] = None,
+                 wallet_file: Optional[str] = "wallet_state.json"):
         """
         Initialize the trading wallet.
         
         Args:
             initial_cash_usd: Initial USD cash amount
             initial_crypto: Initial crypto holdings {symbol: amount}
+            wallet_file: File the wallet is loaded from and saved to, or None for
+                an in-memory wallet that never touches disk
         """
         self.state = WalletState(
             cash_usd=initial_cash_usd,
@@ -43,7 +46,7 @@ class TradingWallet:
             },
             last_updated=datetime.now().isoformat()
         )
-        self.wallet_file = Path("wallet_state.json")
+        self.wallet_file = Path(wallet_file) if wallet_file else None
         self.load_wallet()
     
     def get_portfolio_summary(self) -> str:
@@ -215,6 +218,8 @@ Examples:
     
     def save_wallet(self):
         """Save wallet state to file."""
+        if self.wallet_file is None:
+            return
         try:
             with open(self.wallet_file, 'w') as f:
                 json.dump(self.state.to_dict(), f, indent=2)
@@ -223,6 +228,8 @@ Examples:
     
     def load_wallet(self):
         """Load wallet state from file."""
+        if self.wallet_file is None:
+            return
         try:
             if self.wallet_file.exists():
                 with open(self.wallet_file, 'r') as f:
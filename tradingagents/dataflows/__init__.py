@@ -17,12 +17,16 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_statements,
     # Technical analysis functions
     get_stock_stats_indicators_window,
     get_stockstats_indicator,
+    get_stockstats_indicator_window,
     # Market data functions
     get_YFin_data_window,
     get_YFin_data,
+    # Prefetch
+    prefetch_data,
 )
 
 __all__ = [
@@ -37,10 +41,14 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_statements",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
     "get_stockstats_indicator",
+    "get_stockstats_indicator_window",
     # Market data functions
     "get_YFin_data_window",
     "get_YFin_data",
+    # Prefetch
+    "prefetch_data",
 ]
@@ -0,0 +1,201 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+
+STORE_FORMAT_VERSION = 1
+
+
+class FinnhubTable:
+    """
+    One ticker's Finnhub records for one data type: a records file holding one
+    compact JSON line per date (sorted by date) and an offset index into it.
+    Parsed days are kept in memory, so repeated range queries only parse once.
+    """
+
+    def __init__(self, records_path: str, keys: np.ndarray, offsets: np.ndarray):
+        self.records_path = records_path
+        self.keys = keys
+        self.offsets = offsets
+        self._parsed: List[Optional[list]] = [None] * len(keys)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def locate(self, start_date: str, end_date: str) -> Tuple[int, int]:
+        """Return the [lo, hi) index range of keys with start_date <= key <= end_date."""
+        lo = int(np.searchsorted(self.keys, start_date, "left"))
+        hi = int(np.searchsorted(self.keys, end_date, "right"))
+        return lo, max(lo, hi)
+
+    def _load(self, lo: int, hi: int) -> None:
+        """Parse days lo..hi-1 with a single read of their byte span. Lock held."""
+        with open(self.records_path, "rb") as f:
+            f.seek(int(self.offsets[lo]))
+            chunk = f.read(int(self.offsets[hi] - self.offsets[lo]))
+        for i, line in enumerate(chunk.splitlines(), start=lo):
+            self._parsed[i] = json.loads(line)
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        """Get {date: records} for dates between start_date and end_date (inclusive)."""
+        lo, hi = self.locate(start_date, end_date)
+        with self._lock:
+            missing = [i for i in range(lo, hi) if self._parsed[i] is None]
+            if missing:
+                self._load(missing[0], missing[-1] + 1)
+            return {str(self.keys[i]): self._parsed[i] for i in range(lo, hi)}
+
+
+class FinnhubStore:
+    """
+    Indexed store for the pre-processed Finnhub JSON files. Each
+    {ticker}_data_formatted.json is converted once into a date-sorted records
+    file plus an offset index, so a date window is two binary searches and one
+    read of just the bytes in the window instead of a full json.load.
+    """
+
+    def __init__(self, data_dir: str, store_dir: str):
+        self.data_dir = data_dir
+        self.store_dir = store_dir
+        self._tables: Dict[Tuple[str, str], FinnhubTable] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _name(ticker: str, period: Optional[str] = None) -> str:
+        return f"{ticker}_{period}" if period else ticker
+
+    def json_path(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> str:
+        return os.path.join(
+            self.data_dir,
+            "finnhub_data",
+            data_type,
+            f"{self._name(ticker, period)}_data_formatted.json",
+        )
+
+    def _table_dir(self, name: str, data_type: str) -> str:
+        return os.path.join(self.store_dir, data_type, name)
+
+    def _source_signature(self, json_path: str) -> Dict:
+        stat = os.stat(json_path)
+        return {
+            "format_version": STORE_FORMAT_VERSION,
+            "source": os.path.abspath(json_path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+
+    def _is_fresh(self, table_dir: str, signature: Dict) -> bool:
+        meta_path = os.path.join(table_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return False
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        return all(meta.get(key) == value for key, value in signature.items())
+
+    def build(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> None:
+        """Convert one Finnhub JSON file into the indexed layout (atomic replace)."""
+        json_path = self.json_path(ticker, data_type, period)
+        signature = self._source_signature(json_path)
+        with open(json_path, "r") as f:
+            data = json.load(f)
+
+        # days without records never match a query, so they are not stored
+        keys = sorted(key for key, value in data.items() if len(value) > 0)
+
+        table_dir = self._table_dir(self._name(ticker, period), data_type)
+        os.makedirs(os.path.dirname(table_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(
+            prefix=f".{os.path.basename(table_dir)}-", dir=os.path.dirname(table_dir)
+        )
+        try:
+            offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+            with open(os.path.join(tmp_dir, "records.jsonl"), "wb") as f:
+                for i, key in enumerate(keys):
+                    line = json.dumps(data[key], separators=(",", ":")).encode()
+                    f.write(line + b"\n")
+                    offsets[i + 1] = offsets[i] + len(line) + 1
+            np.save(os.path.join(tmp_dir, "keys.npy"), np.array(keys, dtype=str))
+            np.save(os.path.join(tmp_dir, "offsets.npy"), offsets)
+
+            with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+                json.dump({**signature, "days": len(keys)}, f)
+
+            shutil.rmtree(table_dir, ignore_errors=True)
+            os.rename(tmp_dir, table_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    def load(
+        self, ticker: str, data_type: str, period: Optional[str] = None
+    ) -> FinnhubTable:
+        """
+        Get the indexed table for a ticker, converting the JSON file on first use
+        or whenever it has changed since the last conversion.
+        Raises FileNotFoundError if the ticker has no file for data_type.
+        """
+        name = self._name(ticker, period)
+        with self._lock:
+            table = self._tables.get((data_type, name))
+            if table is not None:
+                return table
+
+            table_dir = self._table_dir(name, data_type)
+            signature = self._source_signature(self.json_path(ticker, data_type, period))
+            if not self._is_fresh(table_dir, signature):
+                self.build(ticker, data_type, period)
+
+            table = FinnhubTable(
+                os.path.join(table_dir, "records.jsonl"),
+                np.load(os.path.join(table_dir, "keys.npy")),
+                np.load(os.path.join(table_dir, "offsets.npy")),
+            )
+            self._tables[(data_type, name)] = table
+            return table
+
+    def get_range(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+        data_type: Annotated[
+            str, "insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported"
+        ],
+        period: Annotated[Optional[str], "annual / quarterly, if any"] = None,
+    ) -> Dict[str, list]:
+        """Get {date: records} for non-empty dates in the window, sorted by date."""
+        return self.load(ticker, data_type, period).range(start_date, end_date)
+
+    def clear(self) -> None:
+        """Drop the in-memory tables and parsed records; on-disk tables are kept."""
+        with self._lock:
+            self._tables.clear()
+
+
+_stores: Dict[Tuple[str, str], FinnhubStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_finnhub_store(
+    data_dir: Annotated[str, "data directory holding finnhub_data"],
+) -> FinnhubStore:
+    """Get the process-wide FinnhubStore for a data directory."""
+    store_dir = os.path.join(get_config()["data_cache_dir"], "finnhub_store")
+    key = (os.path.abspath(data_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = FinnhubStore(data_dir, store_dir)
+            _stores[key] = store
+        return store
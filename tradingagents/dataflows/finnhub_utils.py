@@ -1,5 +1,4 @@
-import json
-import os
+from .finnhub_store import get_finnhub_store
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -11,26 +10,11 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
         data_dir (str): Directory where the data is saved.
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
+    Returns:
+        dict: non-empty records keyed by date (YYYY-MM-DD), in ascending date order.
     """
 
-    if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
-    else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
-
-    data = open(data_path, "r")
-    data = json.load(data)
-
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    # filter keys (date, str in format YYYY-MM-DD) by the date range via the indexed store
+    return get_finnhub_store(data_dir).get_range(
+        ticker, start_date, end_date, data_type, period
+    )
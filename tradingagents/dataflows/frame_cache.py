@@ -0,0 +1,156 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from .config import get_config
+from .indicators import IndicatorEngine, NATIVE_INDICATORS
+
+
+class PreparedFrame:
+    """A symbol's OHLCV frame plus every indicator column computed from it so far."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.dates = data["Date"].astype(str).str[:10]
+        self.engine = IndicatorEngine.from_frame(data)
+        self._stockstats_frame = None
+        self._indicators: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._base_bytes = int(data.memory_usage(deep=True).sum()) + int(
+            self.dates.memory_usage(deep=True)
+        )
+
+    def indicator(self, indicator: str) -> np.ndarray:
+        """Get an indicator column, computing it on first request."""
+        with self._lock:
+            values = self._indicators.get(indicator)
+            if values is None:
+                if indicator in NATIVE_INDICATORS:
+                    values = self.engine.get(indicator)
+                else:
+                    # fall back to stockstats for indicators without a native kernel
+                    if self._stockstats_frame is None:
+                        self._stockstats_frame = wrap(self.data.copy())
+                    values = self._stockstats_frame[indicator].to_numpy().copy()
+                values.flags.writeable = False
+                self._indicators[indicator] = values
+            return values
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the frame and its computed columns."""
+        with self._lock:
+            total = self._base_bytes + self.engine.nbytes
+            if self._stockstats_frame is not None:
+                total += int(self._stockstats_frame.memory_usage(deep=False).sum())
+            return total
+
+
+class FrameCache:
+    """
+    Process-wide LRU cache of PreparedFrames keyed by (symbol, data source, data
+    version), bounded by the approximate bytes held across all entries.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, PreparedFrame]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], pd.DataFrame]
+    ) -> PreparedFrame:
+        """Get the prepared frame for key, loading and inserting it on a miss."""
+        with self._lock:
+            frame = self._entries.get(key)
+            if frame is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return frame
+            self.misses += 1
+
+        frame = PreparedFrame(loader())
+
+        with self._lock:
+            # another thread may have loaded the same key meanwhile
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = frame
+            self._account(key)
+            return frame
+
+    def get_indicator(
+        self, key: Hashable, loader: Callable[[], pd.DataFrame], indicator: str
+    ) -> Tuple[pd.Series, np.ndarray]:
+        """Get (dates, indicator values) for key, computing only what is missing."""
+        frame = self.get_or_load(key, loader)
+        values = frame.indicator(indicator)
+        with self._lock:
+            if key in self._entries:
+                self._account(key)
+        return frame.dates, values
+
+    def _account(self, key: Hashable) -> None:
+        """Refresh the recorded size of key and evict until under the bound. Lock held."""
+        size = self._entries[key].nbytes
+        self.current_bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+        # never evict the entry that was just used, even if it alone is over the bound
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest, _ = next(iter(self._entries.items()))
+            if oldest == key:
+                break
+            self._entries.pop(oldest)
+            self.current_bytes -= self._sizes.pop(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.current_bytes -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_frame_cache: Optional[FrameCache] = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> FrameCache:
+    """Get the process-wide FrameCache, sized from indicator_cache_max_mb."""
+    global _frame_cache
+    with _frame_cache_lock:
+        if _frame_cache is None:
+            max_mb = get_config()["indicator_cache_max_mb"]
+            _frame_cache = FrameCache(int(max_mb * 1024 * 1024))
+        return _frame_cache
@@ -0,0 +1,198 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+STORE_FORMAT_VERSION = 1
+
+# statement name -> (SimFin folder, file prefix)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "balance"),
+    "cashflow": ("cash_flow", "cashflow"),
+    "income": ("income_statements", "income"),
+}
+
+
+class FundamentalsStore:
+    """
+    Point-in-time store for the US-wide SimFin statement CSVs. Each (statement,
+    freq) CSV is split once into per-ticker partitions sorted by Publish Date, so
+    a "latest report as of curr_date" lookup loads one small partition and does a
+    binary search instead of parsing and filtering the whole market's file.
+    """
+
+    def __init__(self, data_dir: str, store_dir: str):
+        self.data_dir = data_dir
+        self.store_dir = store_dir
+        self._partitions: Dict[Tuple[str, str, str], Optional[pd.DataFrame]] = {}
+        self._fresh: Dict[Tuple[str, str], bool] = {}
+        self._lock = threading.Lock()
+
+    def csv_path(self, statement: str, freq: str) -> str:
+        folder, prefix = SIMFIN_STATEMENTS[statement]
+        return os.path.join(
+            self.data_dir,
+            "fundamental_data",
+            "simfin_data_all",
+            folder,
+            "companies",
+            "us",
+            f"us-{prefix}-{freq}.csv",
+        )
+
+    def _partition_dir(self, statement: str, freq: str) -> str:
+        return os.path.join(self.store_dir, f"{statement}-{freq}")
+
+    @staticmethod
+    def _partition_file(ticker: str) -> str:
+        return ticker.replace(os.sep, "_") + ".pkl"
+
+    def _source_signature(self, csv_path: str) -> Dict:
+        stat = os.stat(csv_path)
+        return {
+            "format_version": STORE_FORMAT_VERSION,
+            "source": os.path.abspath(csv_path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+
+    def build(self, statement: str, freq: str) -> None:
+        """Split one statement CSV into sorted per-ticker partitions (atomic replace)."""
+        csv_path = self.csv_path(statement, freq)
+        signature = self._source_signature(csv_path)
+        df = pd.read_csv(csv_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{statement}-{freq}-", dir=self.store_dir)
+        try:
+            tickers = []
+            for ticker, rows in df.groupby("Ticker", sort=False):
+                # keep the original row labels so printed reports match the CSV path
+                rows = rows.sort_values("Publish Date", kind="stable")
+                rows.to_pickle(os.path.join(tmp_dir, self._partition_file(ticker)))
+                tickers.append(ticker)
+
+            with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+                json.dump({**signature, "tickers": len(tickers)}, f)
+
+            partition_dir = self._partition_dir(statement, freq)
+            shutil.rmtree(partition_dir, ignore_errors=True)
+            os.rename(tmp_dir, partition_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    def _ensure_built(self, statement: str, freq: str) -> None:
+        """Build the partitions on first use or whenever the source CSV changed. Lock held."""
+        if self._fresh.get((statement, freq)):
+            return
+
+        signature = self._source_signature(self.csv_path(statement, freq))
+        meta_path = os.path.join(self._partition_dir(statement, freq), "meta.json")
+        fresh = False
+        if os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            fresh = all(meta.get(key) == value for key, value in signature.items())
+
+        if not fresh:
+            self.build(statement, freq)
+            self._partitions = {
+                key: value
+                for key, value in self._partitions.items()
+                if key[:2] != (statement, freq)
+            }
+        self._fresh[(statement, freq)] = True
+
+    def partition(
+        self, ticker: str, statement: str, freq: str
+    ) -> Optional[pd.DataFrame]:
+        """Get all of a ticker's reports for one statement, sorted by Publish Date."""
+        if statement not in SIMFIN_STATEMENTS:
+            raise ValueError(
+                f"Statement {statement} is not supported. Please choose from: {list(SIMFIN_STATEMENTS)}"
+            )
+
+        with self._lock:
+            self._ensure_built(statement, freq)
+            key = (statement, freq, ticker)
+            if key not in self._partitions:
+                path = os.path.join(
+                    self._partition_dir(statement, freq), self._partition_file(ticker)
+                )
+                self._partitions[key] = (
+                    pd.read_pickle(path) if os.path.exists(path) else None
+                )
+            return self._partitions[key]
+
+    def latest(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        statement: Annotated[str, "balance_sheet / cashflow / income"],
+        freq: Annotated[str, "annual / quarterly"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """
+        Get the most recent report published on or before curr_date, or None.
+        Ties on Publish Date resolve to the first row, like idxmax on the CSV.
+        """
+        rows = self.partition(ticker, statement, freq)
+        if rows is None or rows.empty:
+            return None
+
+        publish_dates = rows["Publish Date"].values
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize().to_datetime64()
+
+        pos = int(np.searchsorted(publish_dates, curr_date_dt, side="right")) - 1
+        if pos < 0:
+            return None
+        pos = int(np.searchsorted(publish_dates, publish_dates[pos], side="left"))
+
+        return rows.iloc[pos]
+
+    def latest_statements(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[str, "annual / quarterly"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Dict[str, Optional[pd.Series]]:
+        """Get the latest balance sheet, cash flow and income statement in one call."""
+        return {
+            statement: self.latest(ticker, statement, freq, curr_date)
+            for statement in SIMFIN_STATEMENTS
+        }
+
+    def clear(self) -> None:
+        """Drop the in-memory partitions; on-disk partitions are kept."""
+        with self._lock:
+            self._partitions.clear()
+            self._fresh.clear()
+
+
+_stores: Dict[Tuple[str, str], FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store(
+    data_dir: Annotated[str, "data directory holding fundamental_data/simfin_data_all"],
+) -> FundamentalsStore:
+    """Get the process-wide FundamentalsStore for a data directory."""
+    store_dir = os.path.join(get_config()["data_cache_dir"], "fundamentals_store")
+    key = (os.path.abspath(data_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = FundamentalsStore(data_dir, store_dir)
+            _stores[key] = store
+        return store
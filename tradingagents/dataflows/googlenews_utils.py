@@ -1,9 +1,16 @@
 import json
+import hashlib
+import os
+import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
 import time
-import random
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -12,6 +19,66 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second with bursts of `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_session = None
+_buckets = {}
+_network_lock = threading.Lock()
+
+
+def get_session():
+    """Get the shared requests.Session, pooling connections across calls and threads."""
+    global _session
+    with _network_lock:
+        if _session is None:
+            pool_size = max(get_config()["google_news_concurrency"], 1)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def get_rate_limiter(host):
+    """Get the token bucket shared by every request to host."""
+    with _network_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            config = get_config()
+            bucket = TokenBucket(
+                config["google_news_requests_per_second"],
+                config["google_news_burst"],
+            )
+            _buckets[host] = bucket
+        return bucket
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -25,18 +92,109 @@ def is_rate_limited(response):
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    # Wait for the host's rate limiter instead of a fixed random delay
+    get_rate_limiter(urlparse(url).netloc).acquire()
+    response = get_session().get(url, headers=headers, timeout=30)
     return response
 
 
+def _cache_path(query, start_date, end_date, page):
+    key = json.dumps([query, start_date, end_date, page])
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(get_config()["data_cache_dir"], "google_news", f"{digest}.json")
+
+
+def _read_cached_page(query, start_date, end_date, page):
+    path = _cache_path(query, start_date, end_date, page)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_cached_page(query, start_date, end_date, page, parsed_page):
+    """Write a parsed page atomically; ranges that reach today may still change."""
+    if datetime.strptime(end_date, "%m/%d/%Y").date() >= datetime.now().date():
+        return
+    path = _cache_path(query, start_date, end_date, page)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(parsed_page, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _parse_page(content):
+    """
+    Parse one result page into {"results": [...], "elements": int, "has_next": bool},
+    where elements counts the result elements found, including unparseable ones.
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    elements = soup.select("div.SoaBEf")
+    results = []
+    for el in elements:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = soup.find("a", id="pnnext") is not None
+    return {"results": results, "elements": len(elements), "has_next": has_next}
+
+
+def fetch_page(query, start_date, end_date, page, headers):
+    """Get one parsed result page, from the disk cache when possible."""
+    parsed_page = _read_cached_page(query, start_date, end_date, page)
+    if parsed_page is not None:
+        return parsed_page
+
+    offset = page * 10
+    url = (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+    response = make_request(url, headers)
+    parsed_page = _parse_page(response.content)
+    # consent, captcha and block pages come back as 200 without results; only
+    # pages that actually listed news are worth keeping
+    if response.status_code == 200 and parsed_page["results"]:
+        _write_cached_page(query, start_date, end_date, page, parsed_page)
+    return parsed_page
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    Like a sequential scrape, this stops at the first page that fails, lists no
+    result elements or has no next link. The first page is fetched on its own;
+    once it links to a next page, up to google_news_concurrency pages are kept in
+    flight, and pages still queued past the stopping page are cancelled.
     """
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -53,56 +211,42 @@ def getNewsData(query, start_date, end_date):
         )
     }
 
-    news_results = []
-    page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+    concurrency = max(get_config()["google_news_concurrency"], 1)
 
+    def fetch(page):
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
-
-            page += 1
-
+            return fetch_page(query, start_date, end_date, page, headers)
         except Exception as e:
             print(f"Failed after multiple retries: {e}")
-            break
+            return None
+
+    def is_last(parsed_page):
+        return (
+            parsed_page is None
+            # No more results found
+            or not parsed_page.get("elements", len(parsed_page["results"]))
+            or not parsed_page["has_next"]
+        )
+
+    first_page = fetch(0)
+    if first_page is None:
+        return []
+    news_results = list(first_page["results"])
+    if is_last(first_page):
+        return news_results
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque(executor.submit(fetch, page) for page in range(1, concurrency + 1))
+        next_page = concurrency + 1
+        while pending:
+            parsed_page = pending.popleft().result()
+            if parsed_page is not None:
+                news_results.extend(parsed_page["results"])
+            if is_last(parsed_page):
+                for future in pending:
+                    future.cancel()
+                break
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
 
     return news_results
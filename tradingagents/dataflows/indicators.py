@@ -0,0 +1,306 @@
+"""
+Native NumPy kernels for the technical indicators offered to the market analyst.
+
+Every kernel reproduces the stockstats definition (window defaults, min_periods=1
+rolling windows, adjusted EWM smoothing, zero/0.5/50 fill values) so values are
+interchangeable with StockDataFrame columns, but works on contiguous float64
+arrays and shares intermediates when several indicators are requested together.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# stockstats default windows for the supported indicators
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+NATIVE_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+# largest growth factor allowed inside one block of the linear recurrence
+_MAX_BLOCK_SCALE = 1e8
+
+
+def _linear_recurrence(x: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Evaluate y[t] = x[t] + decay * y[t-1] (with y[-1] = 0) without a Python
+    loop per element: inside a block the recurrence is a rescaled cumsum, and
+    blocks are short enough that the rescaling cannot overflow.
+    """
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    if decay == 0.0:
+        out[:] = x
+        return out
+
+    block = max(1, int(np.log(_MAX_BLOCK_SCALE) / -np.log(decay)))
+    powers = decay ** np.arange(block, dtype=np.float64)
+    inverse_powers = 1.0 / powers
+
+    carry = 0.0
+    for start in range(0, n, block):
+        chunk = x[start : start + block]
+        m = len(chunk)
+        acc = np.cumsum(chunk * inverse_powers[:m]) * powers[:m]
+        acc += carry * decay * powers[:m]
+        out[start : start + m] = acc
+        carry = acc[-1]
+    return out
+
+
+def ewm_mean(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Adjusted exponentially weighted mean, as pandas ewm(adjust=True).mean()."""
+    decay = 1.0 - alpha
+    weights = (1.0 - decay ** np.arange(1, len(x) + 1, dtype=np.float64)) / alpha
+    return _linear_recurrence(x, decay) / weights
+
+
+def ema(x: np.ndarray, window: int) -> np.ndarray:
+    """stockstats ema: span-based adjusted EWM."""
+    return ewm_mean(x, 2.0 / (window + 1.0))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    """stockstats smma: Wilder smoothing (alpha = 1 / window), adjusted EWM."""
+    return ewm_mean(x, 1.0 / window)
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum with min_periods=1."""
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    head = min(window - 1, n)
+    out[:head] = np.cumsum(x[:head])
+    if n >= window:
+        out[window - 1 :] = sliding_window_view(x, window).sum(axis=1)
+    return out
+
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean with min_periods=1."""
+    n = len(x)
+    out = rolling_sum(x, window)
+    head = min(window - 1, n)
+    out[:head] /= np.arange(1, head + 1)
+    out[head:] /= window
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample standard deviation (ddof=1) with min_periods=1."""
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    head = min(window - 1, n)
+    if head > 0:
+        out[0] = np.nan
+    for i in range(1, head):
+        out[i] = np.std(x[: i + 1], ddof=1)
+    if n >= window:
+        out[window - 1 :] = sliding_window_view(x, window).std(axis=1, ddof=1)
+    return out
+
+
+def _cumsum_rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum with min_periods=1 via a running cumsum (stockstats MFI variant)."""
+    cumsum = np.cumsum(x)
+    out = cumsum.copy()
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+class IndicatorEngine:
+    """
+    Computes indicators for one price series. Shared intermediates (EMAs, the
+    typical price, Bollinger statistics, ...) are memoized, so asking for
+    several related indicators costs a single pass over each input.
+    """
+
+    def __init__(
+        self,
+        close: np.ndarray,
+        high: Optional[np.ndarray] = None,
+        low: Optional[np.ndarray] = None,
+        volume: Optional[np.ndarray] = None,
+    ):
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.high = None if high is None else np.ascontiguousarray(high, dtype=np.float64)
+        self.low = None if low is None else np.ascontiguousarray(low, dtype=np.float64)
+        self.volume = (
+            None if volume is None else np.ascontiguousarray(volume, dtype=np.float64)
+        )
+        self._memo: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "IndicatorEngine":
+        """Build from an OHLCV DataFrame (column names are matched case-insensitively)."""
+        columns = {name.lower(): name for name in data.columns}
+
+        def column(name):
+            return data[columns[name]].to_numpy() if name in columns else None
+
+        return cls(column("close"), column("high"), column("low"), column("volume"))
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the input arrays and every memoized series."""
+        inputs = (self.close, self.high, self.low, self.volume)
+        return sum(arr.nbytes for arr in inputs if arr is not None) + sum(
+            arr.nbytes for arr in list(self._memo.values())
+        )
+
+    def _cached(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def _require(self, *names):
+        missing = [name for name in names if getattr(self, name) is None]
+        if missing:
+            raise ValueError(f"Indicator needs price columns: {', '.join(missing)}")
+
+    # building blocks
+
+    def sma(self, window: int) -> np.ndarray:
+        return self._cached(f"sma_{window}", lambda: rolling_mean(self.close, window))
+
+    def ema(self, window: int) -> np.ndarray:
+        return self._cached(f"ema_{window}", lambda: ema(self.close, window))
+
+    def typical_price(self) -> np.ndarray:
+        self._require("high", "low")
+        return self._cached("tp", lambda: (self.close + self.high + self.low) / 3.0)
+
+    # indicators
+
+    def _macd(self):
+        short_w, long_w, signal_w = MACD_WINDOWS
+        macd = self.ema(short_w) - self.ema(long_w)
+        macds = ema(macd, signal_w)
+        self._memo["macd"] = macd
+        self._memo["macds"] = macds
+        self._memo["macdh"] = macd - macds
+
+    def _rsi(self):
+        diff = np.zeros_like(self.close)
+        diff[1:] = np.diff(self.close)
+        up = smma(np.where(diff > 0, diff, 0.0), RSI_WINDOW)
+        down = smma(np.where(diff < 0, -diff, 0.0), RSI_WINDOW)
+        total = up + down
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(total != 0, 100 * (up / total), 50.0)
+        if len(rsi):
+            rsi[0] = 50.0
+        self._memo["rsi"] = np.nan_to_num(rsi, nan=0.0)
+
+    def _boll(self):
+        moving_avg = rolling_mean(self.close, BOLL_WINDOW)
+        width = BOLL_STD_TIMES * rolling_std(self.close, BOLL_WINDOW)
+        self._memo["boll"] = moving_avg
+        self._memo["boll_ub"] = moving_avg + width
+        self._memo["boll_lb"] = moving_avg - width
+
+    def _atr(self):
+        self._require("high", "low")
+        prev_close = np.empty_like(self.close)
+        if len(prev_close):
+            prev_close[0] = self.close[0]
+            prev_close[1:] = self.close[:-1]
+        tr = np.maximum(
+            self.high - self.low,
+            np.maximum(np.abs(self.high - prev_close), np.abs(self.low - prev_close)),
+        )
+        self._memo["atr"] = smma(np.nan_to_num(tr), ATR_WINDOW)
+
+    def _vwma(self):
+        self._require("volume")
+        rolling_tpv = rolling_sum(self.volume * self.typical_price(), VWMA_WINDOW)
+        rolling_vol = rolling_sum(self.volume, VWMA_WINDOW)
+        self._memo["vwma"] = np.divide(
+            rolling_tpv,
+            rolling_vol,
+            out=np.zeros_like(rolling_tpv),
+            where=rolling_vol != 0,
+        )
+
+    def _mfi(self):
+        self._require("volume")
+        tp = self.typical_price()
+        raw_money_flow = tp * self.volume
+        tp_diff = np.zeros_like(tp)
+        tp_diff[1:] = np.diff(tp)
+
+        pos_sum = _cumsum_rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), MFI_WINDOW)
+        neg_sum = _cumsum_rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), MFI_WINDOW)
+        total_flow = pos_sum + neg_sum
+        mfi = np.divide(
+            pos_sum, total_flow, out=np.full_like(pos_sum, 0.5), where=total_flow > 0
+        )
+        mfi[:MFI_WINDOW] = 0.5
+        self._memo["mfi"] = np.nan_to_num(mfi, nan=0.0)
+
+    _FAMILIES = {
+        "macd": _macd,
+        "macds": _macd,
+        "macdh": _macd,
+        "rsi": _rsi,
+        "boll": _boll,
+        "boll_ub": _boll,
+        "boll_lb": _boll,
+        "atr": _atr,
+        "vwma": _vwma,
+        "mfi": _mfi,
+    }
+
+    def get(self, indicator: str) -> np.ndarray:
+        """Get one indicator series, aligned with the input arrays."""
+        if indicator in self._memo:
+            return self._memo[indicator]
+        if indicator == "close_50_sma":
+            return self.sma(50)
+        if indicator == "close_200_sma":
+            return self.sma(200)
+        if indicator == "close_10_ema":
+            return self.ema(10)
+        if indicator not in self._FAMILIES:
+            raise ValueError(
+                f"Indicator {indicator} is not supported natively. Please choose from: {list(NATIVE_INDICATORS)}"
+            )
+        self._FAMILIES[indicator](self)
+        return self._memo[indicator]
+
+    def compute(self, indicators: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Get several indicators at once, sharing intermediate results."""
+        return {indicator: self.get(indicator) for indicator in indicators}
+
+
+def compute_indicators(
+    data: pd.DataFrame, indicators: Iterable[str]
+) -> Dict[str, np.ndarray]:
+    """Compute the requested indicators for an OHLCV DataFrame in one pass."""
+    return IndicatorEngine.from_frame(data).compute(indicators)
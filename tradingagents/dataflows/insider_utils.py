@@ -0,0 +1,84 @@
+from typing import Dict, Hashable, Iterable, Iterator, List
+
+
+def record_key(record) -> Hashable:
+    """
+    Canonical hashable key for a JSON record. Two records get the same key exactly
+    when they compare equal as dicts, independent of key order.
+    """
+    if isinstance(record, dict):
+        return tuple(sorted((key, record_key(value)) for key, value in record.items()))
+    if isinstance(record, list):
+        return tuple(record_key(value) for value in record)
+    return record
+
+
+def unique_records(records_by_day: Dict[str, list]) -> Iterator[dict]:
+    """Stream the records of every day once each, in first-seen order."""
+    seen = set()
+    for records in records_by_day.values():
+        for record in records:
+            key = record_key(record)
+            if key not in seen:
+                seen.add(key)
+                yield record
+
+
+def _number(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def rollup_insider_sentiment(entries: Iterable[dict]) -> List[dict]:
+    """
+    Aggregate insider sentiment rows per month: net change summed and MSPR
+    averaged over the rows of the month, plus the MSPR move from the previous month.
+    """
+    months: Dict[str, dict] = {}
+    for entry in entries:
+        month = f"{entry['year']}-{int(entry['month']):02d}"
+        rollup = months.setdefault(month, {"month": month, "change": 0.0, "mspr": 0.0, "rows": 0})
+        rollup["change"] += _number(entry.get("change"))
+        rollup["mspr"] += _number(entry.get("mspr"))
+        rollup["rows"] += 1
+
+    rollups = [months[month] for month in sorted(months)]
+    previous = None
+    for rollup in rollups:
+        rollup["mspr"] /= rollup["rows"]
+        rollup["mspr_change"] = None if previous is None else rollup["mspr"] - previous
+        previous = rollup["mspr"]
+    return rollups
+
+
+def rollup_insider_transactions(entries: Iterable[dict]) -> List[dict]:
+    """
+    Aggregate insider transactions per month of the transaction date: net shares
+    changed, shares bought (code P) and sold (code S), and the number of filings.
+    """
+    months: Dict[str, dict] = {}
+    for entry in entries:
+        month = str(entry.get("transactionDate") or entry.get("filingDate") or "")[:7]
+        rollup = months.setdefault(
+            month,
+            {"month": month, "net_shares": 0.0, "bought": 0.0, "sold": 0.0, "transactions": 0},
+        )
+        change = _number(entry.get("change"))
+        rollup["net_shares"] += change
+        if entry.get("transactionCode") == "P":
+            rollup["bought"] += abs(change)
+        elif entry.get("transactionCode") == "S":
+            rollup["sold"] += abs(change)
+        rollup["transactions"] += 1
+    return [months[month] for month in sorted(months)]
+
+
+def latest_transactions(entries: Iterable[dict], n: int) -> List[dict]:
+    """Get the n most recent insider transactions by transaction date, oldest first."""
+    ordered = sorted(
+        entries,
+        key=lambda entry: str(entry.get("transactionDate") or entry.get("filingDate") or ""),
+    )
+    return ordered[-n:] if n > 0 else []
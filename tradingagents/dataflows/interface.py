@@ -1,18 +1,28 @@
-from typing import Annotated, Dict
+from typing import Annotated, Dict, Iterable
 from .reddit_utils import fetch_top_from_category
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
+from .fundamentals_store import get_fundamentals_store
+from .indicators import NATIVE_INDICATORS
+from .insider_utils import (
+    latest_transactions,
+    rollup_insider_sentiment,
+    rollup_insider_transactions,
+    unique_records,
+)
+from .openai_cache import get_openai_client, get_response_cache
+from .price_store import get_price_store
+from .reddit_index import get_reddit_index
+from .shared_results import share_results
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
-from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
 
@@ -84,17 +94,17 @@ def get_finnhub_company_insider_sentiment(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    entries = list(unique_records(data))
+
+    rollup_str = "### Monthly rollup (net change, average MSPR, MSPR change vs previous month):\n"
+    for rollup in rollup_insider_sentiment(entries):
+        trend = "n/a" if rollup["mspr_change"] is None else f"{rollup['mspr_change']:+.4g}"
+        rollup_str += f"{rollup['month']}: Change: {rollup['change']:g}, MSPR: {rollup['mspr']:.4g}, MSPR change: {trend}\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
-        + result_str
+        + rollup_str
+        + "\n"
         + "The change field refers to the net buying/selling from all insiders' transactions. The mspr field refers to monthly share purchase ratio."
     )
 
@@ -125,70 +135,68 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
+    entries = list(unique_records(data))
+
+    rollup_str = "### Monthly rollup (by transaction date):\n"
+    for rollup in rollup_insider_transactions(entries):
+        rollup_str += f"{rollup['month']}: Net shares: {rollup['net_shares']:g}, Bought: {rollup['bought']:g}, Sold: {rollup['sold']:g}, Transactions: {rollup['transactions']}\n"
 
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    # The rollup covers every transaction; only the most recent are listed in full
+    recent = latest_transactions(entries, get_config()["insider_transactions_max_rows"])
+    result_str = f"### Most recent {len(recent)} of {len(entries)} transactions:\n"
+    for entry in recent:
+        result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
+        + rollup_str
+        + "\n"
         + result_str
         + "The change field reflects the variation in share count—here a negative number indicates a reduction in holdings—while share specifies the total number of shares involved. The transactionPrice denotes the per-share price at which the trade was executed, and transactionDate marks when the transaction occurred. The name field identifies the insider making the trade, and transactionCode (e.g., S for sale) clarifies the nature of the transaction. FilingDate records when the transaction was officially reported, and the unique id links to the specific SEC filing, as indicated by the source. Additionally, the symbol ties the transaction to a particular company, isDerivative flags whether the trade involves derivative securities, and currency notes the currency context of the transaction."
     )
 
 
-def get_simfin_balance_sheet(
-    ticker: Annotated[str, "ticker symbol"],
-    freq: Annotated[
-        str,
-        "reporting frequency of the company's financial history: annual / quarterly",
-    ],
-    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+# Heading, missing-report notice and explanation for each SimFin statement
+SIMFIN_REPORT_TEXT = {
+    "balance_sheet": (
+        "balance sheet",
+        "No balance sheet available before the given current date.",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity.",
+    ),
+    "cashflow": (
+        "cash flow statement",
+        "No cash flow statement available before the given current date.",
+        "This includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period.",
+    ),
+    "income": (
+        "income statement",
+        "No income statement available before the given current date.",
+        "This includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period.",
+    ),
+}
+
+
+def _format_simfin_statement(ticker, freq, statement, report):
+    """Render one statement row for the agents, or "" if there is none."""
+    title, missing, explanation = SIMFIN_REPORT_TEXT[statement]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No balance sheet available before the given current date.")
+    if report is None:
+        print(missing)
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
-    latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
+    report = report.drop("SimFinId")
 
     return (
-        f"## {freq} balance sheet for {ticker} released on {str(latest_balance_sheet['Publish Date'])[0:10]}: \n"
-        + str(latest_balance_sheet)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of assets, liabilities, and equity. Assets are grouped as current (liquid items like cash and receivables) and noncurrent (long-term investments and property). Liabilities are split between short-term obligations and long-term debts, while equity reflects shareholder funds such as paid-in capital and retained earnings. Together, these components ensure that total assets equal the sum of liabilities and equity."
+        f"## {freq} {title} for {ticker} released on {str(report['Publish Date'])[0:10]}: \n"
+        + str(report)
+        + "\n\n"
+        + explanation
     )
 
 
-def get_simfin_cashflow(
+def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
@@ -196,43 +204,26 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # Get the most recent balance sheet published on or before the current date
+    latest_balance_sheet = get_fundamentals_store(DATA_DIR).latest(
+        ticker, "balance_sheet", freq, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    return _format_simfin_statement(ticker, freq, "balance_sheet", latest_balance_sheet)
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No cash flow statement available before the given current date.")
-        return ""
-
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_cash_flow = latest_cash_flow.drop("SimFinId")
-
-    return (
-        f"## {freq} cash flow statement for {ticker} released on {str(latest_cash_flow['Publish Date'])[0:10]}: \n"
-        + str(latest_cash_flow)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a breakdown of cash movements. Operating activities show cash generated from core business operations, including net income adjustments for non-cash items and working capital changes. Investing activities cover asset acquisitions/disposals and investments. Financing activities include debt transactions, equity issuances/repurchases, and dividend payments. The net change in cash represents the overall increase or decrease in the company's cash position during the reporting period."
+def get_simfin_cashflow(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    # Get the most recent cash flow statement published on or before the current date
+    latest_cash_flow = get_fundamentals_store(DATA_DIR).latest(
+        ticker, "cashflow", freq, curr_date
     )
+    return _format_simfin_statement(ticker, freq, "cashflow", latest_cash_flow)
 
 
 def get_simfin_income_statements(
@@ -243,43 +234,28 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+    # Get the most recent income statement published on or before the current date
+    latest_income = get_fundamentals_store(DATA_DIR).latest(
+        ticker, "income", freq, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
-
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print("No income statement available before the given current date.")
-        return ""
+    return _format_simfin_statement(ticker, freq, "income", latest_income)
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
 
-    # drop the SimFinID column
-    latest_income = latest_income.drop("SimFinId")
-
-    return (
-        f"## {freq} income statement for {ticker} released on {str(latest_income['Publish Date'])[0:10]}: \n"
-        + str(latest_income)
-        + "\n\nThis includes metadata like reporting dates and currency, share details, and a comprehensive breakdown of the company's financial performance. Starting with Revenue, it shows Cost of Revenue and resulting Gross Profit. Operating Expenses are detailed, including SG&A, R&D, and Depreciation. The statement then shows Operating Income, followed by non-operating items and Interest Expense, leading to Pretax Income. After accounting for Income Tax and any Extraordinary items, it concludes with Net Income, representing the company's bottom-line profit or loss for the period."
-    )
+def get_simfin_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> str:
+    """Get the latest balance sheet, cash flow and income statement in one call."""
+    latest = get_fundamentals_store(DATA_DIR).latest_statements(ticker, freq, curr_date)
+    reports = [
+        _format_simfin_statement(ticker, freq, statement, report)
+        for statement, report in latest.items()
+    ]
+    return "\n\n".join(report for report in reports if report)
 
 
 def get_google_news(
@@ -308,6 +284,7 @@ def get_google_news(
     return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
 
 
+@share_results()
 def get_reddit_global_news(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
@@ -326,26 +303,15 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # fetch every day from before to start_date in one pass over the indexed archive
+    posts_by_day = get_reddit_index(os.path.join(DATA_DIR, "reddit_data")).fetch_range(
+        "global_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+    )
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -380,31 +346,16 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # fetch every day from before to start_date in one pass over the indexed archive
+    posts_by_day = get_reddit_index(os.path.join(DATA_DIR, "reddit_data")).fetch_range(
+        "company_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        ticker,
     )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
+    posts = [post for day_posts in posts_by_day.values() for post in day_posts]
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -511,39 +462,23 @@ def get_stock_stats_indicators_window(
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
-        )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+    # compute the indicator once and slice the whole look-back window from it
+    indicator_values = get_stockstats_indicator_window(
+        symbol, indicator, before.strftime("%Y-%m-%d"), end_date, online
+    )
 
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
+    ind_string = ""
+    while curr_date >= before:
+        curr_date_str = curr_date.strftime("%Y-%m-%d")
+        if curr_date_str in indicator_values:
+            ind_string += f"{curr_date_str}: {indicator_values[curr_date_str]}\n"
+        elif online:
+            # online reports every calendar day, offline only the trading dates
+            ind_string += (
+                f"{curr_date_str}: N/A: Not a trading day (weekend or holiday)\n"
             )
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
+        curr_date = curr_date - relativedelta(days=1)
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
@@ -584,6 +519,35 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def get_stockstats_indicator_window(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> Dict[str, str]:
+    """
+    Retrieve an indicator for every trading day between start_date and end_date
+    (inclusive) from a single computation of the indicator series.
+    Returns:
+        dict: trading date (yyyy-mm-dd) to indicator value
+    Raises:
+        Exception: when the price data is missing or the indicator cannot be
+        computed, rather than reporting an empty window
+    """
+
+    indicator_values = StockstatsUtils.get_stock_stats_window(
+        symbol,
+        indicator,
+        start_date,
+        end_date,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        online=online,
+    )
+
+    return {date: str(value) for date, value in indicator_values.items()}
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -594,24 +558,10 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # slice the rows between the start and end dates (inclusive) from the price store
+    filtered_data = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).get_frame(symbol, start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -672,29 +622,18 @@ def get_YFin_data(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    # load the columnar price table
+    price_table = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).load(symbol)
 
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Slice data between the start and end dates (inclusive)
+    filtered_data = price_table.slice(start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -702,11 +641,10 @@ def get_YFin_data(
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
+def _openai_web_search(function, ticker, curr_date, prompt):
+    """Run a web-search Responses call through the shared client and response cache."""
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
+    request = dict(
         model=config["quick_think_llm"],
         input=[
             {
@@ -714,7 +652,7 @@ def get_stock_news_openai(ticker, curr_date):
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -734,74 +672,125 @@ def get_stock_news_openai(ticker, curr_date):
         store=True,
     )
 
-    return response.output[1].content[0].text
+    def call():
+        client = get_openai_client(config["backend_url"])
+        response = client.responses.create(**request)
+        return response.output[1].content[0].text
 
+    return get_response_cache().get_or_call(function, ticker, curr_date, request, call)
 
-def get_global_news_openai(curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+def get_stock_news_openai(ticker, curr_date):
+    return _openai_web_search(
+        "get_stock_news_openai",
+        ticker,
+        curr_date,
+        f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
     )
 
-    return response.output[1].content[0].text
 
+# Only in-flight calls are shared; the response cache owns expiry and record/replay
+@share_results(keep_results=False)
+def get_global_news_openai(curr_date):
+    return _openai_web_search(
+        "get_global_news_openai",
+        "",
+        curr_date,
+        f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
+    )
 
-def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+def get_fundamentals_openai(ticker, curr_date):
+    return _openai_web_search(
+        "get_fundamentals_openai",
+        ticker,
+        curr_date,
+        f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
     )
 
-    return response.output[1].content[0].text
+
+def prefetch_data(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    online: Annotated[bool, "to fetch data online or offline"],
+    max_workers: Annotated[int, "number of parallel fetches"] = 8,
+    analysts: Annotated[
+        Iterable[str], "analysts whose data to fetch: market / social / news / fundamentals"
+    ] = ("market", "social", "news", "fundamentals"),
+) -> Dict[str, str]:
+    """
+    Fetch the standard data bundle of the selected analysts for a (ticker, curr_date)
+    run in parallel, with the same arguments their tools use, so the stores and
+    caches behind those tools are warm before the analysts start. Failures are
+    reported, not raised.
+    Returns {task name: "ok in Xs" or the error message}.
+    """
+    before = (
+        datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(days=30)
+    ).strftime("%Y-%m-%d")
+
+    indicators = {
+        f"indicator:{indicator}": (
+            get_stock_stats_indicators_window,
+            (ticker, indicator, curr_date, 30, online),
+        )
+        for indicator in NATIVE_INDICATORS
+    }
+    if online:
+        tasks_by_analyst = {"market": indicators}
+        # the web-search answers are only reused when the response cache is read
+        # from; in "record" and "off" mode prefetching them would pay twice
+        if get_config()["openai_cache_mode"] in ("cache", "replay"):
+            tasks_by_analyst.update(
+                {
+                    "social": {
+                        "stock_news_openai": (get_stock_news_openai, (ticker, curr_date)),
+                    },
+                    "news": {"global_news_openai": (get_global_news_openai, (curr_date,))},
+                    "fundamentals": {
+                        "fundamentals_openai": (get_fundamentals_openai, (ticker, curr_date)),
+                    },
+                }
+            )
+    else:
+        tasks_by_analyst = {
+            "market": {
+                **indicators,
+                "price_window": (get_YFin_data, (ticker, before, curr_date)),
+            },
+            "social": {
+                "reddit_company_news": (get_reddit_company_news, (ticker, curr_date, 7, 5)),
+            },
+            "news": {
+                "finnhub_news": (get_finnhub_news, (ticker, curr_date, 7)),
+                "reddit_global_news": (get_reddit_global_news, (curr_date, 7, 5)),
+            },
+            "fundamentals": {
+                "insider_sentiment": (
+                    get_finnhub_company_insider_sentiment,
+                    (ticker, curr_date, 30),
+                ),
+                "insider_transactions": (
+                    get_finnhub_company_insider_transactions,
+                    (ticker, curr_date, 30),
+                ),
+                "simfin_quarterly": (get_simfin_statements, (ticker, "quarterly", curr_date)),
+                "simfin_annual": (get_simfin_statements, (ticker, "annual", curr_date)),
+            },
+        }
+
+    tasks = {}
+    for analyst in analysts:
+        tasks.update(tasks_by_analyst.get(analyst, {}))
+
+    def run(item):
+        name, (func, args) = item
+        start = datetime.now()
+        try:
+            func(*args)
+        except Exception as e:
+            return name, f"failed: {type(e).__name__}: {e}"
+        return name, f"ok in {(datetime.now() - start).total_seconds():.2f}s"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(run, tasks.items()))
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Annotated, Callable, Dict, Optional
+
+from openai import OpenAI
+
+from .config import get_config
+
+# cache modes: "cache" reads through, "record" always calls and overwrites,
+# "replay" never calls the API (a miss is an error), "off" bypasses the cache
+CACHE_MODES = ("cache", "record", "replay", "off")
+
+
+class ResponseCache:
+    """
+    Persistent cache of web-search Responses results keyed by (function, ticker,
+    curr_date, model, prompt hash). Answers about past dates are treated as
+    immutable; answers about today or later expire after ttl_hours.
+    """
+
+    def __init__(self, cache_dir: str, mode: str = "cache", ttl_hours: float = 6):
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"OpenAI cache mode {mode} is not supported. Please choose from: {list(CACHE_MODES)}"
+            )
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.ttl_hours = ttl_hours
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def prompt_hash(request: Dict) -> str:
+        """Hash of the full request (prompt, tools and sampling parameters)."""
+        payload = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(
+        self, function: str, ticker: str, curr_date: str, model: str, prompt_hash: str
+    ) -> str:
+        key = json.dumps([function, ticker, curr_date, model, prompt_hash])
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, function, f"{digest}.json")
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        if entry["curr_date"] < datetime.now().strftime("%Y-%m-%d"):
+            return True
+        return time.time() - entry["created_at"] <= self.ttl_hours * 3600
+
+    def _read(self, path: str) -> Optional[Dict]:
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _write(self, path: str, entry: Dict) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get_or_call(
+        self,
+        function: Annotated[str, "name of the dataflow function"],
+        ticker: Annotated[str, "ticker symbol, empty for market-wide queries"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+        request: Annotated[Dict, "keyword arguments of the Responses call"],
+        call: Callable[[], str],
+    ) -> str:
+        """Get the cached text for the request, calling the API on a miss."""
+        if self.mode == "off":
+            return call()
+
+        model = request.get("model", "")
+        path = self.path(function, ticker, curr_date, model, self.prompt_hash(request))
+
+        if self.mode != "record":
+            entry = self._read(path)
+            if entry is not None and (self.mode == "replay" or self._is_fresh(entry)):
+                with self._lock:
+                    self.hits += 1
+                return entry["text"]
+            if self.mode == "replay":
+                raise KeyError(
+                    f"No recorded response for {function}({ticker}, {curr_date}) with model {model}"
+                )
+
+        with self._lock:
+            self.misses += 1
+        text = call()
+        self._write(
+            path,
+            {
+                "function": function,
+                "ticker": ticker,
+                "curr_date": curr_date,
+                "model": model,
+                "created_at": time.time(),
+                "text": text,
+            },
+        )
+        return text
+
+
+_clients: Dict[str, OpenAI] = {}
+_response_cache: Optional[ResponseCache] = None
+_lock = threading.Lock()
+
+
+def get_openai_client(base_url: Annotated[str, "OpenAI-compatible API base URL"]) -> OpenAI:
+    """Get the process-wide OpenAI client for base_url (its HTTP pool is reused)."""
+    with _lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = OpenAI(base_url=base_url)
+            _clients[base_url] = client
+        return client
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide ResponseCache, configured from openai_cache_mode/_ttl_hours."""
+    global _response_cache
+    config = get_config()
+    cache_dir = os.path.join(config["data_cache_dir"], "openai_responses")
+    with _lock:
+        if (
+            _response_cache is None
+            or _response_cache.cache_dir != cache_dir
+            or _response_cache.mode != config["openai_cache_mode"]
+        ):
+            _response_cache = ResponseCache(
+                cache_dir,
+                config["openai_cache_mode"],
+                config["openai_cache_ttl_hours"],
+            )
+        return _response_cache
@@ -0,0 +1,273 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+OFFLINE_PRICE_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+STORE_FORMAT_VERSION = 2
+# Replaced generations are kept this long for readers still opening them
+GENERATION_GRACE_SECONDS = 60
+
+
+class PriceTable:
+    """Memory-mapped columns of one symbol's price history, indexed by trading day."""
+
+    def __init__(
+        self,
+        symbol: str,
+        days: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        column_order: List[str],
+        version: str = "",
+    ):
+        self.symbol = symbol
+        self.days = days
+        self.columns = columns
+        self.column_order = column_order
+        self.version = version
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def locate(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """Return the [lo, hi) row range covering start_date..end_date inclusive."""
+        lo = 0
+        hi = len(self.days)
+        if start_date is not None:
+            lo = int(
+                np.searchsorted(self.days, np.datetime64(start_date[:10], "D"), "left")
+            )
+        if end_date is not None:
+            hi = int(
+                np.searchsorted(self.days, np.datetime64(end_date[:10], "D"), "right")
+            )
+        return lo, max(lo, hi)
+
+    def has_date(self, date: str) -> bool:
+        """Check whether date (yyyy-mm-dd) is a trading day in the table."""
+        lo, hi = self.locate(date, date)
+        return hi > lo
+
+    def slice(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Slice the table to a DataFrame between start_date and end_date (inclusive).
+        Numeric columns are views on the memory-mapped arrays; the index keeps the
+        original CSV row numbers so printed output matches a full read_csv.
+        """
+        lo, hi = self.locate(start_date, end_date)
+        frame = pd.DataFrame(
+            {name: self.columns[name][lo:hi] for name in self.column_order},
+            copy=False,
+        )
+        frame.index = pd.RangeIndex(lo, hi)
+        return frame
+
+
+class PriceStore:
+    """
+    Columnar store for the offline YFinance price CSVs. Each CSV is converted once
+    into per-column .npy files plus a parsed day index, then memory-mapped on load,
+    so every later lookup is a binary search and a slice instead of a CSV parse.
+
+    Each conversion is written to its own generation directory and published by
+    atomically replacing a `current` pointer file, so readers in other processes
+    never see a half-written or missing table.
+    """
+
+    def __init__(self, price_dir: str, store_dir: str):
+        self.price_dir = price_dir
+        self.store_dir = store_dir
+        self._tables: Dict[str, PriceTable] = {}
+        self._lock = threading.Lock()
+
+    def csv_path(self, symbol: str) -> str:
+        return os.path.join(self.price_dir, OFFLINE_PRICE_FILE.format(symbol=symbol))
+
+    def _table_dir(self, symbol: str) -> str:
+        return os.path.join(self.store_dir, symbol)
+
+    def _source_signature(self, csv_path: str) -> Dict:
+        stat = os.stat(csv_path)
+        return {
+            "format_version": STORE_FORMAT_VERSION,
+            "source": os.path.abspath(csv_path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+
+    @staticmethod
+    def _version(signature: Dict) -> str:
+        return f"{signature['source_size']}-{signature['source_mtime_ns']}"
+
+    def _current_dir(self, symbol: str) -> Optional[str]:
+        """Generation directory the symbol's `current` pointer names, if any."""
+        try:
+            with open(os.path.join(self._table_dir(symbol), "current"), "r") as f:
+                name = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return os.path.join(self._table_dir(symbol), name)
+
+    def _is_fresh(self, symbol: str, signature: Dict) -> bool:
+        current_dir = self._current_dir(symbol)
+        if current_dir is None:
+            return False
+        meta_path = os.path.join(current_dir, "meta.json")
+        if not os.path.exists(meta_path):
+            return False
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        return all(meta.get(key) == value for key, value in signature.items())
+
+    def build(self, symbol: str) -> None:
+        """Convert the symbol's CSV into the columnar layout (atomic replace)."""
+        csv_path = self.csv_path(symbol)
+        signature = self._source_signature(csv_path)
+        data = pd.read_csv(csv_path)
+
+        days = pd.to_datetime(data["Date"].astype(str).str[:10]).values.astype(
+            "datetime64[D]"
+        )
+        order = np.argsort(days, kind="stable")
+        if not np.all(order == np.arange(len(order))):
+            data = data.iloc[order].reset_index(drop=True)
+            days = days[order]
+
+        table_dir = self._table_dir(symbol)
+        os.makedirs(table_dir, exist_ok=True)
+        generation_dir = tempfile.mkdtemp(prefix="v-", dir=table_dir)
+        try:
+            np.save(os.path.join(generation_dir, "_days.npy"), days)
+            columns = []
+            for i, name in enumerate(data.columns):
+                values = data[name].to_numpy()
+                if values.dtype == object:
+                    values = values.astype(str)
+                np.save(os.path.join(generation_dir, f"{i}.npy"), values)
+                columns.append(name)
+
+            # meta.json is written last; a generation without it is unfinished
+            with open(os.path.join(generation_dir, "meta.json"), "w") as f:
+                json.dump({**signature, "columns": columns, "rows": len(days)}, f)
+
+            previous_dir = self._current_dir(symbol)
+            fd, tmp_pointer = tempfile.mkstemp(prefix=".current-", dir=table_dir)
+            with os.fdopen(fd, "w") as f:
+                f.write(os.path.basename(generation_dir))
+            os.replace(tmp_pointer, os.path.join(table_dir, "current"))
+        except Exception:
+            shutil.rmtree(generation_dir, ignore_errors=True)
+            raise
+
+        self._tables.pop(symbol, None)
+        self._remove_stale_generations(symbol, {generation_dir, previous_dir})
+
+    def _remove_stale_generations(self, symbol: str, keep: set) -> None:
+        """
+        Delete finished generations other than `keep` once they are older than
+        GENERATION_GRACE_SECONDS. Recent ones may still be opened by readers
+        that resolved an older pointer; unfinished ones may belong to a
+        concurrent build.
+        """
+        table_dir = self._table_dir(symbol)
+        for name in os.listdir(table_dir):
+            path = os.path.join(table_dir, name)
+            if path in keep:
+                continue
+            if name.startswith("v-"):
+                try:
+                    age = time.time() - os.path.getmtime(os.path.join(path, "meta.json"))
+                except FileNotFoundError:
+                    continue
+                if age > GENERATION_GRACE_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+            elif name == "meta.json" or name.endswith(".npy"):
+                # Files of the single-directory layout before generations
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def _open(self, symbol: str) -> PriceTable:
+        table_dir = self._current_dir(symbol)
+        if table_dir is None:
+            raise FileNotFoundError(f"No price table has been built for {symbol}")
+        with open(os.path.join(table_dir, "meta.json"), "r") as f:
+            meta = json.load(f)
+
+        days = np.load(os.path.join(table_dir, "_days.npy"), mmap_mode="r")
+        columns = {
+            name: np.load(os.path.join(table_dir, f"{i}.npy"), mmap_mode="r")
+            for i, name in enumerate(meta["columns"])
+        }
+        version = self._version(meta)
+        return PriceTable(symbol, days, columns, meta["columns"], version)
+
+    def load(self, symbol: str) -> PriceTable:
+        """
+        Get the memory-mapped table for a symbol, converting the CSV on first use
+        or whenever the CSV has changed since the last conversion. Open tables
+        are re-checked against the CSV on every call, so a long-lived process
+        picks up changed data.
+        Raises FileNotFoundError if the symbol has no offline CSV.
+        """
+        with self._lock:
+            signature = self._source_signature(self.csv_path(symbol))
+            table = self._tables.get(symbol)
+            if table is not None and table.version == self._version(signature):
+                return table
+
+            if not self._is_fresh(symbol, signature):
+                self.build(symbol)
+            try:
+                table = self._open(symbol)
+            except FileNotFoundError:
+                # A concurrent build removed the generation between pointer and open
+                self.build(symbol)
+                table = self._open(symbol)
+            self._tables[symbol] = table
+            return table
+
+    def get_frame(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format"] = None,
+        end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format"] = None,
+    ) -> pd.DataFrame:
+        """Get the symbol's price rows between start_date and end_date (inclusive)."""
+        return self.load(symbol).slice(start_date, end_date)
+
+    def clear(self) -> None:
+        """Drop the in-memory handles; on-disk tables are kept."""
+        with self._lock:
+            self._tables.clear()
+
+
+_stores: Dict[Tuple[str, str], PriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(
+    price_dir: Annotated[str, "directory holding the offline YFinance CSVs"],
+) -> PriceStore:
+    """Get the process-wide PriceStore for a price directory."""
+    store_dir = os.path.join(get_config()["data_cache_dir"], "price_store")
+    key = (os.path.abspath(price_dir), os.path.abspath(store_dir))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = PriceStore(price_dir, store_dir)
+            _stores[key] = store
+        return store
@@ -0,0 +1,261 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+from .reddit_utils import mentioned_tickers, ticker_to_company
+
+INDEX_FORMAT_VERSION = 2
+
+
+class SubredditIndex:
+    """
+    Index over one subreddit .jsonl file: the byte offset, length, post day and
+    upvotes of every post, sorted by day (file order within a day), plus a
+    posting list of post rows for every ticker mentioned in the post.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        days: np.ndarray,
+        offsets: np.ndarray,
+        lengths: np.ndarray,
+        upvotes: np.ndarray,
+        postings: Dict[str, np.ndarray],
+    ):
+        self.path = path
+        self.days = days
+        self.offsets = offsets
+        self.lengths = lengths
+        self.upvotes = upvotes
+        self.postings = postings
+
+    def top_rows(
+        self, start_date: str, end_date: str, limit: int, ticker: Optional[str] = None
+    ) -> List[int]:
+        """
+        Rows of the `limit` most upvoted posts of every day between start_date and
+        end_date (inclusive), optionally only posts mentioning ticker.
+        """
+        lo = int(np.searchsorted(self.days, np.datetime64(start_date, "D"), "left"))
+        hi = int(np.searchsorted(self.days, np.datetime64(end_date, "D"), "right"))
+        rows = np.arange(lo, max(lo, hi))
+        if ticker is not None:
+            rows = np.intersect1d(rows, self.postings.get(ticker, rows[:0]))
+
+        selected = []
+        if len(rows) == 0:
+            return selected
+
+        row_days = self.days[rows]
+        day_starts = np.flatnonzero(row_days[1:] != row_days[:-1]) + 1
+        for day_rows in np.split(rows, day_starts):
+            # stable, like list.sort(reverse=True) on the posts in file order
+            order = np.argsort(-self.upvotes[day_rows], kind="stable")
+            selected.extend(day_rows[order[:limit]].tolist())
+        return selected
+
+    def read(self, rows: List[int]) -> List[dict]:
+        """Parse the posts at rows, reading the file once in offset order."""
+        posts = {}
+        with open(self.path, "rb") as f:
+            for row in sorted(rows, key=lambda r: self.offsets[r]):
+                f.seek(int(self.offsets[row]))
+                posts[row] = json.loads(f.read(int(self.lengths[row])))
+        return [posts[row] for row in rows]
+
+
+class RedditIndex:
+    """
+    One-time indexer for the Reddit archive under reddit_data/{category}. Every
+    subreddit file is scanned once (and again only when it changes), so a date
+    range query is a binary search per file followed by reads of just the
+    selected posts, instead of parsing the whole category for every day.
+    """
+
+    def __init__(self, data_path: str, store_dir: str):
+        self.data_path = data_path
+        self.store_dir = store_dir
+        self._indexes: Dict[Tuple[str, str], Tuple[Dict, SubredditIndex]] = {}
+        self._lock = threading.Lock()
+
+    def _index_path(self, category: str, data_file: str) -> str:
+        return os.path.join(self.store_dir, category, data_file + ".npz")
+
+    def _source_signature(self, path: str) -> Dict:
+        stat = os.stat(path)
+        return {
+            "format_version": INDEX_FORMAT_VERSION,
+            "source": os.path.abspath(path),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "tickers": sorted(ticker_to_company),
+        }
+
+    def build(self, category: str, data_file: str) -> None:
+        """Scan one subreddit file and write its index (atomic replace)."""
+        path = os.path.join(self.data_path, category, data_file)
+        signature = self._source_signature(path)
+        track_mentions = "company" in category
+
+        days, offsets, lengths, upvotes = [], [], [], []
+        mentions: Dict[str, List[int]] = {}
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                if line.strip():
+                    parsed_line = json.loads(line)
+                    row = len(days)
+                    days.append(
+                        datetime.utcfromtimestamp(parsed_line["created_utc"]).strftime(
+                            "%Y-%m-%d"
+                        )
+                    )
+                    offsets.append(offset)
+                    lengths.append(len(line))
+                    upvotes.append(parsed_line["ups"])
+                    if track_mentions:
+                        for ticker in mentioned_tickers(
+                            parsed_line["title"], parsed_line["selftext"]
+                        ):
+                            mentions.setdefault(ticker, []).append(row)
+                offset += len(line)
+
+        days = np.array(days, dtype="datetime64[D]")
+        order = np.argsort(days, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        arrays = {
+            "days": days[order],
+            "offsets": np.array(offsets, dtype=np.int64)[order],
+            "lengths": np.array(lengths, dtype=np.int64)[order],
+            "upvotes": np.array(upvotes, dtype=np.float64)[order],
+        }
+        for ticker, rows in mentions.items():
+            arrays[f"mentions_{ticker}"] = np.sort(rank[np.array(rows, dtype=np.int64)])
+
+        index_path = self._index_path(category, data_file)
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{data_file}-", suffix=".npz", dir=os.path.dirname(index_path)
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, meta=np.array(json.dumps(signature)), **arrays)
+            os.replace(tmp_path, index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _read_index(self, category: str, data_file: str) -> Tuple[Dict, SubredditIndex]:
+        path = os.path.join(self.data_path, category, data_file)
+        with np.load(self._index_path(category, data_file)) as npz:
+            meta = json.loads(str(npz["meta"]))
+            postings = {
+                name[len("mentions_") :]: npz[name]
+                for name in npz.files
+                if name.startswith("mentions_")
+            }
+            index = SubredditIndex(
+                path,
+                npz["days"],
+                npz["offsets"],
+                npz["lengths"],
+                npz["upvotes"],
+                postings,
+            )
+        return meta, index
+
+    def load(self, category: str, data_file: str) -> SubredditIndex:
+        """Get the index of one subreddit file, (re)building it when stale."""
+        path = os.path.join(self.data_path, category, data_file)
+        signature = self._source_signature(path)
+        with self._lock:
+            cached = self._indexes.get((category, data_file))
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+            index_path = self._index_path(category, data_file)
+            if os.path.exists(index_path):
+                cached = self._read_index(category, data_file)
+            if cached is None or cached[0] != signature:
+                self.build(category, data_file)
+                cached = self._read_index(category, data_file)
+
+            self._indexes[(category, data_file)] = cached
+            return cached[1]
+
+    def fetch_range(
+        self,
+        category: Annotated[str, "Category to fetch top posts from. Collection of subreddits."],
+        start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd"],
+        end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd"],
+        max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+        query: Annotated[str, "Optional ticker whose company must be mentioned."] = None,
+    ) -> Dict[str, List[dict]]:
+        """
+        Get {date: posts} for every date between start_date and end_date, with the
+        same per-subreddit limits and ordering as fetch_top_from_category per day.
+        """
+        category_dir = os.path.join(self.data_path, category)
+        data_files = os.listdir(category_dir)
+
+        if max_limit < len(data_files):
+            raise ValueError(
+                "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+            )
+
+        limit_per_subreddit = max_limit // len(data_files)
+
+        ticker = None
+        if "company" in category and query:
+            if query not in ticker_to_company:
+                raise KeyError(query)
+            ticker = query
+
+        results: Dict[str, List[dict]] = {}
+        for data_file in data_files:
+            # check if data_file is a .jsonl file
+            if not data_file.endswith(".jsonl"):
+                continue
+
+            index = self.load(category, data_file)
+            rows = index.top_rows(start_date, end_date, limit_per_subreddit, ticker)
+            for row, parsed_line in zip(rows, index.read(rows)):
+                post_date = str(index.days[row])
+                results.setdefault(post_date, []).append(
+                    {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": post_date,
+                    }
+                )
+
+        return {date: results[date] for date in sorted(results)}
+
+
+_indexes: Dict[Tuple[str, str], RedditIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_reddit_index(
+    data_path: Annotated[str, "Path to the reddit_data folder."],
+) -> RedditIndex:
+    """Get the process-wide RedditIndex for a reddit_data folder."""
+    store_dir = os.path.join(get_config()["data_cache_dir"], "reddit_index")
+    key = (os.path.abspath(data_path), os.path.abspath(store_dir))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = RedditIndex(data_path, store_dir)
+            _indexes[key] = index
+        return index
@@ -3,7 +3,8 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Dict, Iterable, List, Pattern, Set
 import os
 import re
 
@@ -49,6 +50,67 @@ ticker_to_company = {
 }
 
 
+def company_search_terms(ticker: str) -> List[str]:
+    """Search terms for a ticker: its company names plus the ticker itself."""
+    if "OR" in ticker_to_company[ticker]:
+        search_terms = ticker_to_company[ticker].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[ticker]]
+
+    search_terms.append(ticker)
+    return [term.strip() for term in search_terms if term.strip()]
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    # longest first so a company name wins over a shorter term at the same position;
+    # lookarounds instead of \b so terms ending in punctuation ("Snap Inc.") still match
+    escaped = sorted({re.escape(term) for term in terms}, key=len, reverse=True)
+    return r"(?<!\w)(?:" + "|".join(escaped) + r")(?!\w)"
+
+
+@lru_cache(maxsize=None)
+def company_matcher(ticker: str) -> Pattern:
+    """One compiled, case-insensitive, whole-word pattern for all of a ticker's terms."""
+    return re.compile(_alternation(company_search_terms(ticker)), re.IGNORECASE)
+
+
+class CompanyMentionTagger:
+    """
+    Tags text with every ticker it mentions using a single compiled alternation of
+    all search terms, so the whole universe is matched in one scan of the text.
+    """
+
+    def __init__(self, companies: Dict[str, str]):
+        self._term_tickers: Dict[str, Set[str]] = {}
+        for ticker in companies:
+            for term in company_search_terms(ticker):
+                self._term_tickers.setdefault(term.lower(), set()).add(ticker)
+        self._order = {ticker: i for i, ticker in enumerate(companies)}
+        # zero-width lookahead so matches may start inside a previous match
+        self._pattern = re.compile(
+            r"(?=(" + _alternation(self._term_tickers) + r"))", re.IGNORECASE
+        )
+
+    def tag(self, *texts: str) -> List[str]:
+        """Get the tickers mentioned in any of texts, in ticker_to_company order."""
+        found: Set[str] = set()
+        for text in texts:
+            for match in self._pattern.finditer(text):
+                found |= self._term_tickers[match.group(1).lower()]
+        return sorted(found, key=self._order.__getitem__)
+
+
+@lru_cache(maxsize=1)
+def get_mention_tagger() -> CompanyMentionTagger:
+    """Get the shared tagger for every ticker in ticker_to_company."""
+    return CompanyMentionTagger(ticker_to_company)
+
+
+def mentioned_tickers(title: str, selftext: str) -> List[str]:
+    """Get every ticker in ticker_to_company mentioned in a post's title or text."""
+    return get_mention_tagger().tag(title, selftext)
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -98,23 +160,11 @@ def fetch_top_from_category(
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
                 if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
+                    matcher = company_matcher(query)
+                    if not (
+                        matcher.search(parsed_line["title"])
+                        or matcher.search(parsed_line["selftext"])
+                    ):
                         continue
 
                 post = {
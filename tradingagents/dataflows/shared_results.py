@@ -0,0 +1,55 @@
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable, Tuple
+
+
+def share_results(maxsize: int = 256, keep_results: bool = True) -> Callable:
+    """
+    Decorator for ticker-independent dataflows (e.g. global news for a date).
+    Concurrent callers with the same arguments wait on one in-flight call, and
+    the last `maxsize` results are reused by later callers in the process.
+    Failed calls are not kept, so the next caller retries. With keep_results
+    off, results are dropped once the in-flight call finishes, for dataflows
+    whose own cache decides when a result goes stale.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        results: "OrderedDict[Hashable, Future]" = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key: Tuple = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                future = results.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    results[key] = future
+                    while len(results) > maxsize:
+                        results.popitem(last=False)
+                else:
+                    results.move_to_end(key)
+
+            if owner:
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    with lock:
+                        if results.get(key) is future:
+                            del results[key]
+                    future.set_exception(e)
+                else:
+                    if not keep_results:
+                        with lock:
+                            if results.get(key) is future:
+                                del results[key]
+                    future.set_result(result)
+            return future.result()
+
+        wrapper.cache_clear = lambda: results.clear()
+        return wrapper
+
+    return decorator
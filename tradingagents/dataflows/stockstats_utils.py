@@ -1,21 +1,17 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, Tuple
 import os
 from .config import get_config
+from .frame_cache import get_frame_cache
+from .price_store import get_price_store
+from .yfin_cache import get_yfin_cache
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def get_stock_data(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
             "directory where the stock data is stored.",
@@ -25,63 +21,112 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
+        """Load the symbol's raw OHLCV price history with a YYYY-mm-dd prefixed Date column."""
         data = None
 
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
+                data = get_price_store(data_dir).get_frame(symbol)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
+            # incremental cache: only bars after the last stored date are downloaded
+            data = get_yfin_cache(get_config()["data_cache_dir"]).get_history(symbol)
+            data = data.assign(Date=data["Date"].dt.strftime("%Y-%m-%d"))
 
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
+        return data
 
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
+    @staticmethod
+    def get_indicator_series(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Get the full indicator series for a symbol from the process-wide frame cache,
+        keyed by (symbol, data source, data version). The OHLCV frame is loaded and
+        each indicator computed only on the first request for that key.
+        Returns the YYYY-mm-dd dates and the aligned indicator values.
+        """
+        if not online:
+            try:
+                version = get_price_store(data_dir).load(symbol).version
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            key = (symbol, f"offline:{os.path.abspath(data_dir)}", version)
+        else:
+            key = (symbol, "online", pd.Timestamp.today().strftime("%Y-%m-%d"))
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+        return get_frame_cache().get_indicator(
+            key,
+            lambda: StockstatsUtils.get_stock_data(symbol, data_dir, online),
+            indicator,
+        )
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        dates, values = StockstatsUtils.get_indicator_series(
+            symbol, indicator, data_dir, online
+        )
+        curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        matching_rows = np.flatnonzero((dates == curr_date).to_numpy())
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if len(matching_rows) > 0:
+            indicator_value = values[matching_rows[0]]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end of the window (inclusive), YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute the indicator series once and return every trading day between
+        start_date and end_date (inclusive), indexed by YYYY-mm-dd.
+        """
+        dates, values = StockstatsUtils.get_indicator_series(
+            symbol, indicator, data_dir, online
+        )
+        in_window = ((dates >= start_date) & (dates <= end_date)).to_numpy()
+
+        return pd.Series(values[in_window], index=dates.to_numpy()[in_window])
@@ -0,0 +1,153 @@
+import os
+import tempfile
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+# relative tolerance when checking that re-fetched overlap bars still match the cache
+ADJUSTMENT_TOLERANCE = 1e-6
+
+
+class IncrementalPriceCache:
+    """
+    Append-only cache of daily yfinance bars, one canonical CSV per symbol.
+
+    The first request for a symbol downloads `history_years` of bars; later
+    requests only fetch the bars after the last stored date, re-fetching the last
+    stored bar as an overlap check. auto_adjust prices are rewritten by yfinance
+    after splits and dividends, so if the overlap bar no longer matches, the whole
+    history is downloaded again instead of appending inconsistent rows.
+    """
+
+    def __init__(self, cache_dir: str, history_years: int = 15):
+        self.cache_dir = cache_dir
+        self.history_years = history_years
+        self._frames: Dict[str, Tuple[str, pd.DataFrame]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data.csv")
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    @staticmethod
+    def _download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        data = yf.download(
+            symbol,
+            start=start_date,
+            end=end_date,
+            multi_level_index=False,
+            progress=False,
+            auto_adjust=True,
+        )
+        data = data.reset_index()
+        if not data.empty and data["Date"].dt.tz is not None:
+            data["Date"] = data["Date"].dt.tz_localize(None)
+        return data
+
+    def _read(self, symbol: str) -> Optional[pd.DataFrame]:
+        if not os.path.exists(self.path(symbol)):
+            return None
+        data = pd.read_csv(self.path(symbol))
+        data["Date"] = pd.to_datetime(data["Date"])
+        return data
+
+    def _write(self, symbol: str, data: pd.DataFrame) -> None:
+        """Write the history atomically so readers never see a partial file."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{symbol}-", suffix=".csv", dir=self.cache_dir
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                data.to_csv(f, index=False)
+            os.replace(tmp_path, self.path(symbol))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _full_download(self, symbol: str, today: pd.Timestamp) -> pd.DataFrame:
+        start_date = today - pd.DateOffset(years=self.history_years)
+        return self._download(
+            symbol, start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+        )
+
+    def _overlap_matches(self, stored: pd.DataFrame, fetched: pd.DataFrame) -> bool:
+        last_date = stored["Date"].iloc[-1]
+        overlap = fetched[fetched["Date"] == last_date]
+        if overlap.empty:
+            return True
+        stored_close = float(stored["Close"].iloc[-1])
+        fetched_close = float(overlap["Close"].iloc[0])
+        return abs(fetched_close - stored_close) <= ADJUSTMENT_TOLERANCE * max(
+            abs(stored_close), 1.0
+        )
+
+    def refresh(self, symbol: str, today: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Bring the symbol's cached history up to (but excluding) today and return it."""
+        today = (today or pd.Timestamp.today()).normalize()
+        stored = self._read(symbol)
+
+        if stored is None or stored.empty:
+            data = self._full_download(symbol, today)
+        else:
+            last_date = stored["Date"].iloc[-1].normalize()
+            if last_date + pd.Timedelta(days=1) >= today:
+                return stored
+
+            # re-fetch the last stored bar to detect retroactive price adjustments
+            fetched = self._download(
+                symbol, last_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+            )
+            if fetched.empty:
+                return stored
+            if not self._overlap_matches(stored, fetched):
+                data = self._full_download(symbol, today)
+            else:
+                data = pd.concat([stored, fetched], ignore_index=True)
+                data = data.drop_duplicates(subset="Date", keep="last")
+                data = data.sort_values("Date").reset_index(drop=True)
+
+        if not data.empty:
+            self._write(symbol, data)
+        return data
+
+    def get_history(
+        self, symbol: Annotated[str, "ticker symbol of the company"]
+    ) -> pd.DataFrame:
+        """
+        Get the symbol's daily history. The on-disk cache is refreshed at most once
+        per calendar day per process; later calls return the in-memory frame.
+        """
+        today = pd.Timestamp.today().strftime("%Y-%m-%d")
+        with self._lock_for(symbol):
+            cached = self._frames.get(symbol)
+            if cached is not None and cached[0] == today:
+                return cached[1]
+
+            data = self.refresh(symbol)
+            self._frames[symbol] = (today, data)
+            return data
+
+
+_caches: Dict[str, IncrementalPriceCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_yfin_cache(cache_dir: Optional[str] = None) -> IncrementalPriceCache:
+    """Get the process-wide incremental yfinance cache for a cache directory."""
+    cache_dir = os.path.abspath(cache_dir or get_config()["data_cache_dir"])
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = IncrementalPriceCache(cache_dir)
+            _caches[cache_dir] = cache
+        return cache
@@ -17,6 +17,31 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    "debate_recent_turns": 4,
+    "debate_token_budget": 4000,
+    "debate_convergence_threshold": 0.6,
+    "parallel_analysts": True,
+    "propagate_workers": 4,
+    "checkpoint_db": os.path.join(
+        os.getenv("TRADINGAGENTS_RESULTS_DIR", "./results"), "checkpoints.sqlite"
+    ),
+    # Resume a (company, date) run that stopped part-way instead of starting over;
+    # only safe when the config and selected analysts are unchanged
+    "resume_runs": False,
     # Tool settings
     "online_tools": True,
+    "prefetch_data": True,
+    "prefetch_workers": 8,
+    "google_news_concurrency": 3,
+    "google_news_requests_per_second": 0.5,
+    "google_news_burst": 3,
+    "insider_transactions_max_rows": 10,
+    # Cache settings
+    "indicator_cache_max_mb": 512,
+    "analyst_report_cache": True,
+    "llm_cache": False,
+    "llm_cache_max_mb": 256,
+    "prompt_cache_markers": True,
+    "openai_cache_mode": os.getenv("TRADINGAGENTS_OPENAI_CACHE_MODE", "cache"),
+    "openai_cache_ttl_hours": 6,
 }
@@ -0,0 +1,196 @@
+# TradingAgents/graph/backtest.py
+
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from tradingagents.agents.utils.trade_executor import TradeExecutor
+from tradingagents.agents.utils.wallet import TradingWallet
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.price_store import get_price_store
+
+
+class Backtester:
+    """Walks a date range per ticker with analyze, feeding realized returns back
+    into reflect_and_remember and checkpointing after every date.
+
+    Decisions are scored from the position they take, never traded: every date
+    runs against a fresh in-memory wallet, so the saved wallet is left untouched
+    and a date re-run after a crash has no side effects."""
+
+    MEMORY_NAMES = (
+        "bull_memory",
+        "bear_memory",
+        "trader_memory",
+        "invest_judge_memory",
+        "risk_manager_memory",
+    )
+
+    def __init__(self, graph, checkpoint_dir: Optional[str] = None, holding_days: int = 1):
+        """Initialize the backtester.
+
+        Args:
+            graph: TradingAgentsGraph to run
+            checkpoint_dir: Directory for per-ticker checkpoints (defaults to
+                results_dir/backtests)
+            holding_days: Trading days a position is held to compute its return
+        """
+        self.graph = graph
+        self.checkpoint_dir = checkpoint_dir or os.path.join(
+            get_config()["results_dir"], "backtests"
+        )
+        self.holding_days = holding_days
+
+    def _price_table(self, ticker: str):
+        price_dir = os.path.join(get_config()["data_dir"], "market_data", "price_data")
+        return get_price_store(price_dir).load(ticker)
+
+    def trading_days(self, ticker: str, start_date: str, end_date: str) -> List[str]:
+        """Trading days in the offline price data between start_date and end_date."""
+        table = self._price_table(ticker)
+        lo, hi = table.locate(start_date, end_date)
+        return [str(day) for day in table.days[lo:hi]]
+
+    def realized_return(self, ticker: str, trade_date: str) -> Optional[float]:
+        """Close-to-close return over holding_days after trade_date, or None if unknown."""
+        table = self._price_table(ticker)
+        if not table.has_date(trade_date):
+            return None
+        lo, _ = table.locate(trade_date, trade_date)
+        exit_row = lo + self.holding_days
+        if exit_row >= len(table):
+            return None
+        close = table.columns["Close"]
+        return float(close[exit_row] / close[lo] - 1.0)
+
+    @staticmethod
+    def position_return(decision: str, realized_return: float) -> float:
+        """Return of the position taken: long for BUY, short for SELL, flat for HOLD."""
+        action, _, _ = TradeExecutor.parse_trade_decision(decision)
+        if action == "BUY":
+            return realized_return
+        if action == "SELL":
+            return -realized_return
+        return 0.0
+
+    def _checkpoint_path(self, ticker: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{ticker}.json")
+
+    def load_checkpoint(self, ticker: str) -> Dict[str, Any]:
+        """Get the ticker's checkpoint, or an empty one if there is none yet."""
+        path = self._checkpoint_path(ticker)
+        if not os.path.exists(path):
+            return {"records": [], "memories": None, "timings": {}, "elapsed": 0.0}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, ticker: str, checkpoint: Dict[str, Any]) -> None:
+        """Write the checkpoint atomically so a crash never leaves a partial file."""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=self.checkpoint_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp_path, self._checkpoint_path(ticker))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _snapshot_memories(self) -> Dict[str, Any]:
+        return {name: getattr(self.graph, name).snapshot() for name in self.MEMORY_NAMES}
+
+    def _restore_memories(self, memories: Dict[str, Any]) -> None:
+        for name in self.MEMORY_NAMES:
+            getattr(self.graph, name).restore(memories[name])
+
+    def run(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Backtest one ticker over [start_date, end_date], resuming from its checkpoint.
+
+        Returns:
+            Summary with per-date records, cumulative position return, throughput
+            (dates per hour) and total and mean seconds per stage.
+        """
+        checkpoint = self.load_checkpoint(ticker)
+        if checkpoint["memories"] is not None:
+            self._restore_memories(checkpoint["memories"])
+
+        done = {record["trade_date"] for record in checkpoint["records"]}
+        pending = [
+            day for day in self.trading_days(ticker, start_date, end_date) if day not in done
+        ]
+
+        for trade_date in pending:
+            date_start = time.perf_counter()
+            timings: Dict[str, float] = {}
+
+            final_state, decision = self.graph.analyze(
+                ticker, trade_date, wallet=TradingWallet(wallet_file=None), timings=timings
+            )
+
+            realized = self.realized_return(ticker, trade_date)
+            position = None
+            if realized is not None:
+                position = self.position_return(decision, realized)
+                stage_start = time.perf_counter()
+                self.graph.reflect_and_remember(position, final_state)
+                timings["reflect"] = time.perf_counter() - stage_start
+
+            elapsed = time.perf_counter() - date_start
+            checkpoint["records"].append(
+                {
+                    "trade_date": trade_date,
+                    "decision": decision,
+                    "realized_return": realized,
+                    "position_return": position,
+                    "seconds": elapsed,
+                    "timings": timings,
+                }
+            )
+            for stage, seconds in timings.items():
+                checkpoint["timings"][stage] = checkpoint["timings"].get(stage, 0.0) + seconds
+            checkpoint["elapsed"] += elapsed
+            checkpoint["memories"] = self._snapshot_memories()
+            self._save_checkpoint(ticker, checkpoint)
+
+            if self.graph.debug:
+                print(
+                    f"[{ticker} {trade_date}] {decision} "
+                    f"position return {position} in {elapsed:.1f}s"
+                )
+
+        return self.summary(ticker, checkpoint)
+
+    def summary(self, ticker: str, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a checkpoint: returns, throughput and per-stage timings."""
+        records = sorted(checkpoint["records"], key=lambda record: record["trade_date"])
+        cumulative = 1.0
+        for record in records:
+            if record["position_return"] is not None:
+                cumulative *= 1.0 + record["position_return"]
+
+        elapsed = checkpoint["elapsed"]
+        return {
+            "ticker": ticker,
+            "dates": len(records),
+            "cumulative_return": cumulative - 1.0,
+            "dates_per_hour": len(records) / elapsed * 3600 if elapsed > 0 else 0.0,
+            "stage_seconds": dict(
+                sorted(checkpoint["timings"].items(), key=lambda item: -item[1])
+            ),
+            "stage_mean_seconds": {
+                stage: seconds / len(records)
+                for stage, seconds in checkpoint["timings"].items()
+            },
+            "records": records,
+        }
+
+    def save_summary(self, summary: Dict[str, Any]) -> str:
+        """Write a summary as JSON next to the checkpoints and return its path."""
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = os.path.join(self.checkpoint_dir, f"{summary['ticker']}_summary.json")
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=4)
+        return path
@@ -0,0 +1,40 @@
+# TradingAgents/graph/checkpointer.py
+
+import os
+import sqlite3
+import threading
+from typing import Annotated, Dict
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+_checkpointers: Dict[str, SqliteSaver] = {}
+_lock = threading.Lock()
+
+
+def run_thread_id(company_name: str, trade_date: str) -> str:
+    """Checkpoint thread holding the runs of one (company, date)."""
+    return f"{company_name}:{trade_date}"
+
+
+def get_checkpointer(
+    db_path: Annotated[str, "SQLite file holding the graph checkpoints"],
+) -> SqliteSaver:
+    """Get the process-wide SQLite checkpointer for db_path.
+
+    The wallet in AgentState is not msgpack-serializable, so values fall back to
+    pickle. The saver serializes access to its connection, so graphs running on
+    several threads can share it.
+    """
+    key = os.path.abspath(db_path)
+    with _lock:
+        checkpointer = _checkpointers.get(key)
+        if checkpointer is None:
+            os.makedirs(os.path.dirname(key), exist_ok=True)
+            conn = sqlite3.connect(key, check_same_thread=False)
+            checkpointer = SqliteSaver(
+                conn, serde=JsonPlusSerializer(pickle_fallback=True)
+            )
+            checkpointer.setup()
+            _checkpointers[key] = checkpointer
+        return checkpointer
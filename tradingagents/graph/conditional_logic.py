@@ -1,15 +1,66 @@
 # TradingAgents/graph/conditional_logic.py
 
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
 from tradingagents.agents.utils.agent_states import AgentState
 
 
 class ConditionalLogic:
     """Handles conditional logic for determining graph flow."""
 
-    def __init__(self, max_debate_rounds=1, max_risk_discuss_rounds=1):
-        """Initialize with configuration parameters."""
+    def __init__(
+        self,
+        max_debate_rounds=1,
+        max_risk_discuss_rounds=1,
+        convergence_threshold=None,
+    ):
+        """Initialize with configuration parameters.
+
+        With a convergence_threshold, a debate goes to its judge as soon as
+        every participant's latest argument is at least that similar to their
+        previous one; the round limits stay as the cap.
+        """
         self.max_debate_rounds = max_debate_rounds
         self.max_risk_discuss_rounds = max_risk_discuss_rounds
+        self.convergence_threshold = convergence_threshold
+
+    @staticmethod
+    def _bigrams(text: str) -> Counter:
+        words = re.findall(r"[a-z0-9$%.]+", text.split(":", 1)[-1].lower())
+        return Counter(zip(words, words[1:]))
+
+    @classmethod
+    def similarity(cls, a: str, b: str) -> float:
+        """Cosine similarity of the word bigram counts of two arguments."""
+        a_counts, b_counts = cls._bigrams(a), cls._bigrams(b)
+        dot = sum(count * b_counts[bigram] for bigram, count in a_counts.items())
+        norm = math.sqrt(sum(c * c for c in a_counts.values())) * math.sqrt(
+            sum(c * c for c in b_counts.values())
+        )
+        return dot / norm if norm else 0.0
+
+    def _converged(self, turns: List[str], speakers: int) -> bool:
+        """Whether each of the last `speakers` turns repeats that speaker's previous turn."""
+        if self.convergence_threshold is None or len(turns) < 2 * speakers:
+            return False
+        return all(
+            self.similarity(turns[i], turns[i - speakers]) >= self.convergence_threshold
+            for i in range(len(turns) - speakers, len(turns))
+        )
+
+    def turns_saved(self, state: AgentState) -> Dict[str, int]:
+        """Debate turns skipped by converging before the round limits."""
+        return {
+            "investment_debate": max(
+                2 * self.max_debate_rounds - state["investment_debate_state"]["count"], 0
+            ),
+            "risk_debate": max(
+                3 * self.max_risk_discuss_rounds - state["risk_debate_state"]["count"], 0
+            ),
+        }
 
     def should_continue_market(self, state: AgentState):
         """Determine if market analysis should continue."""
@@ -50,6 +101,8 @@ class ConditionalLogic:
             state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds
         ):  # 3 rounds of back-and-forth between 2 agents
             return "Research Manager"
+        if self._converged(state["investment_debate_state"].get("turns", []), 2):
+            return "Research Manager"
         if state["investment_debate_state"]["current_response"].startswith("Bull"):
             return "Bear Researcher"
         return "Bull Researcher"
@@ -60,6 +113,8 @@ class ConditionalLogic:
             state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds
         ):  # 3 rounds of back-and-forth between 3 agents
             return "Risk Judge"
+        if self._converged(state["risk_debate_state"].get("turns", []), 3):
+            return "Risk Judge"
         if state["risk_debate_state"]["latest_speaker"].startswith("Risky"):
             return "Safe Analyst"
         if state["risk_debate_state"]["latest_speaker"].startswith("Safe"):
@@ -0,0 +1,177 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Annotated, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration
+from langgraph.config import get_config as get_runnable_config
+
+
+class SQLiteResponseCache(BaseCache):
+    """
+    Exact-match LLM response cache in SQLite, plugged into the chat models via
+    their `cache` argument. LangChain keys each call on the normalized messages
+    and an llm_string covering the model, sampling parameters and bound tools.
+    Least recently used entries are evicted once the database holds more than
+    max_mb of responses. Hits and misses are counted per graph node.
+    """
+
+    def __init__(self, db_path: str, max_mb: float = 256):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        self.set_max_mb(max_mb)
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode()).hexdigest()
+
+    @staticmethod
+    def _dumps(generations: RETURN_VAL_TYPE) -> str:
+        # Ids are dropped so each replay gets a fresh one, as add_messages merges by id
+        return json.dumps(
+            [
+                {
+                    "message": message_to_dict(
+                        generation.message.model_copy(update={"id": None})
+                    ),
+                    "generation_info": generation.generation_info,
+                }
+                for generation in generations
+            ]
+        )
+
+    @staticmethod
+    def _loads(value: str) -> RETURN_VAL_TYPE:
+        return [
+            ChatGeneration(
+                message=messages_from_dict([generation["message"]])[0],
+                generation_info=generation["generation_info"],
+            )
+            for generation in json.loads(value)
+        ]
+
+    @staticmethod
+    def _node() -> str:
+        """Name of the graph node making the call, if called inside the graph."""
+        try:
+            return get_runnable_config().get("metadata", {}).get("langgraph_node", "")
+        except RuntimeError:
+            return ""
+
+    def _count(self, outcome: str) -> None:
+        node_stats = self._stats.setdefault(self._node(), {"hits": 0, "misses": 0})
+        node_stats[outcome] += 1
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self._count("hits")
+        return self._loads(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = self._key(prompt, llm_string)
+        value = self._dumps(return_val)
+        size = len(value.encode())
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def set_max_mb(self, max_mb: float) -> None:
+        """Change the size limit, evicting entries if the cache is now over it."""
+        with self._lock:
+            self.max_bytes = int(max_mb * 1024 * 1024)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is within max_bytes."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+
+    def clear(self, **kwargs) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get hits, misses and hit rate per graph node ("" for calls outside the graph)."""
+        with self._lock:
+            return {
+                node: {
+                    **counts,
+                    "hit_rate": counts["hits"] / (counts["hits"] + counts["misses"]),
+                }
+                for node, counts in self._stats.items()
+            }
+
+
+_llm_caches: Dict[str, SQLiteResponseCache] = {}
+_lock = threading.Lock()
+
+
+def get_llm_cache(
+    db_path: Annotated[str, "SQLite file holding the LLM responses"],
+    max_mb: Annotated[float, "size above which least recently used responses are evicted"],
+) -> SQLiteResponseCache:
+    """Get the process-wide response cache for db_path."""
+    key = os.path.abspath(db_path)
+    with _lock:
+        cache = _llm_caches.get(key)
+        if cache is None:
+            cache = SQLiteResponseCache(key, max_mb)
+            _llm_caches[key] = cache
+        elif cache.max_bytes != int(max_mb * 1024 * 1024):
+            cache.set_max_mb(max_mb)
+        return cache
@@ -1,6 +1,6 @@
 # TradingAgents/graph/propagation.py
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -17,14 +17,15 @@ class Propagator:
         self.max_recur_limit = max_recur_limit
 
     def create_initial_state(
-        self, company_name: str, trade_date: str
+        self, company_name: str, trade_date: str, wallet: Optional[TradingWallet] = None
     ) -> Dict[str, Any]:
-        """Create the initial state for the agent graph."""
+        """Create the initial state for the agent graph, with the saved wallet unless
+        another one is given."""
         return {
             "messages": [("human", company_name)],
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
-            "wallet": TradingWallet(),  # Initialize wallet
+            "wallet": wallet if wallet is not None else TradingWallet(),  # Initialize wallet
             "investment_debate_state": InvestDebateState(
                 {"history": "", "current_response": "", "count": 0}
             ),
@@ -49,3 +50,16 @@ class Propagator:
             "stream_mode": "values",
             "config": {"recursion_limit": self.max_recur_limit},
         }
+
+    def get_stream_args(self) -> Dict[str, Any]:
+        """Get arguments for streaming LLM token deltas and per-node updates.
+
+        Unlike "values", neither mode re-sends the whole state after every step.
+        Output from the analyst branch subgraphs is included, so the graph yields
+        (namespace, mode, chunk) tuples.
+        """
+        return {
+            "stream_mode": ["messages", "updates"],
+            "subgraphs": True,
+            "config": {"recursion_limit": self.max_recur_limit},
+        }
@@ -0,0 +1,184 @@
+# TradingAgents/graph/report_cache.py
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Annotated, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from tradingagents.agents.utils import crypto_utils
+from tradingagents.dataflows.config import get_config
+
+
+# Tools that fetch over the network; re-running them would cost fresh calls and
+# need not return the same data, so their outputs are not re-checked on lookup
+ONLINE_TOOLS = frozenset(
+    {
+        "get_YFin_data_online",
+        "get_stockstats_indicators_report_online",
+        "get_google_news",
+        "get_stock_news_openai",
+        "get_global_news_openai",
+        "get_fundamentals_openai",
+    }
+)
+
+
+def _digest(value) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def prompt_fingerprint(factory: Callable) -> str:
+    """Hash of the source an analyst's prompt is built from (its module and crypto_utils)."""
+    sources = [
+        inspect.getsource(sys.modules[factory.__module__]),
+        inspect.getsource(crypto_utils),
+    ]
+    return hashlib.sha256("\n".join(sources).encode()).hexdigest()
+
+
+def tool_fingerprints(messages: List[BaseMessage]) -> List[Dict]:
+    """Every tool call in an analyst conversation, with a hash of the data it returned."""
+    outputs = {
+        message.tool_call_id: message.content
+        for message in messages
+        if isinstance(message, ToolMessage)
+    }
+    fingerprints = []
+    for message in messages:
+        if not isinstance(message, AIMessage):
+            continue
+        for tool_call in message.tool_calls:
+            fingerprints.append(
+                {
+                    "name": tool_call["name"],
+                    "args": tool_call["args"],
+                    "output_hash": _digest(outputs.get(tool_call["id"], "")),
+                }
+            )
+    return fingerprints
+
+
+class AnalystReportCache:
+    """
+    Persistent cache of analyst reports keyed by (ticker, trade_date, analyst,
+    model, prompt hash). An entry also records the tool calls behind the report
+    and hashes of their outputs. Calls to offline tools are re-run on lookup
+    (cheap, as the local stores are cached) and the entry is only reused while
+    they return the same data. Calls to online tools are trusted as keyed, but
+    for a trade date of today or later the entry expires after ttl_hours, as
+    the web-search responses do.
+    """
+
+    def __init__(self, cache_dir: str, ttl_hours: float = 6):
+        self.cache_dir = cache_dir
+        self.ttl_hours = ttl_hours
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path(
+        self,
+        ticker: str,
+        trade_date: str,
+        analyst: str,
+        model: str,
+        prompt_hash: str,
+    ) -> str:
+        digest = _digest([ticker, trade_date, analyst, model, prompt_hash])
+        return os.path.join(self.cache_dir, analyst, f"{digest}.json")
+
+    def _is_fresh(self, entry: Dict, trade_date: str) -> bool:
+        if trade_date < datetime.now().strftime("%Y-%m-%d"):
+            return True
+        if not any(call["name"] in ONLINE_TOOLS for call in entry["tool_calls"]):
+            return True
+        return time.time() - entry.get("created_at", 0) <= self.ttl_hours * 3600
+
+    def _tool_data_matches(self, entry: Dict, tools_by_name: Dict) -> bool:
+        for fingerprint in entry["tool_calls"]:
+            if fingerprint["name"] in ONLINE_TOOLS:
+                continue
+            tool = tools_by_name.get(fingerprint["name"])
+            if tool is None:
+                return False
+            try:
+                output = tool.invoke(fingerprint["args"])
+            except Exception:
+                return False
+            if not isinstance(output, str):
+                output = str(output)
+            if _digest(output) != fingerprint["output_hash"]:
+                return False
+        return True
+
+    def lookup(
+        self,
+        path: Annotated[str, "entry path from AnalystReportCache.path"],
+        tools_by_name: Annotated[Dict, "tools the analyst may call, by name"],
+        trade_date: Annotated[str, "trade date the entry was keyed on, yyyy-mm-dd"],
+    ) -> Optional[str]:
+        """Get the cached report if it is fresh and its offline tool data is unchanged, else None."""
+        entry = None
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                entry = json.load(f)
+
+        hit = (
+            entry is not None
+            and self._is_fresh(entry, trade_date)
+            and self._tool_data_matches(entry, tools_by_name)
+        )
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry["report"] if hit else None
+
+    def store(
+        self,
+        path: Annotated[str, "entry path from AnalystReportCache.path"],
+        report: Annotated[str, "the analyst's final report"],
+        messages: Annotated[List[BaseMessage], "conversation that produced the report"],
+    ) -> None:
+        """Write an entry atomically."""
+        entry = {
+            "report": report,
+            "tool_calls": tool_fingerprints(messages),
+            "created_at": time.time(),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+_report_cache: Optional[AnalystReportCache] = None
+_lock = threading.Lock()
+
+
+def get_report_cache() -> AnalystReportCache:
+    """Get the process-wide AnalystReportCache under data_cache_dir."""
+    global _report_cache
+    config = get_config()
+    cache_dir = os.path.join(config["data_cache_dir"], "analyst_reports")
+    with _lock:
+        if _report_cache is None or _report_cache.cache_dir != cache_dir:
+            _report_cache = AnalystReportCache(cache_dir, config["openai_cache_ttl_hours"])
+        _report_cache.ttl_hours = config["openai_cache_ttl_hours"]
+        return _report_cache
@@ -1,6 +1,8 @@
 # TradingAgents/graph/setup.py
 
 from typing import Dict, Any
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -10,6 +12,15 @@ from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
 
 from .conditional_logic import ConditionalLogic
+from .report_cache import AnalystReportCache, prompt_fingerprint
+
+# state key each analyst writes its report to
+ANALYST_REPORT_KEYS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
 
 
 class GraphSetup:
@@ -27,6 +38,7 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        report_cache: AnalystReportCache = None,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -39,9 +51,89 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.report_cache = report_cache
+
+    def _cache_analyst(self, analyst_type, analyst_node, factory):
+        """Wrap an analyst node to reuse its report while its inputs are unchanged.
+
+        The cache is looked up when the analyst's conversation starts; a hit
+        answers with the report and no tool calls, so the tool loop ends at once.
+        """
+        report_key = ANALYST_REPORT_KEYS[analyst_type]
+        tools_by_name = self.tool_nodes[analyst_type].tools_by_name
+        config = self.toolkit.config
+        model = f"{config['llm_provider']}:{config['backend_url']}:{config['quick_think_llm']}"
+        prompt_hash = prompt_fingerprint(factory)
+
+        def cached_analyst_node(state):
+            # The tool set (online or offline) is part of the prompt
+            path = self.report_cache.path(
+                state["company_of_interest"],
+                state["trade_date"],
+                analyst_type,
+                model,
+                f"{prompt_hash}:{config['online_tools']}",
+            )
+            if not any(isinstance(m, AIMessage) for m in state["messages"]):
+                report = self.report_cache.lookup(
+                    path, tools_by_name, str(state["trade_date"])
+                )
+                if report is not None:
+                    return {"messages": [AIMessage(content=report)], report_key: report}
+
+            result = analyst_node(state)
+            if result[report_key]:
+                self.report_cache.store(path, result[report_key], state["messages"])
+            return result
+
+        return cached_analyst_node
+
+    def _create_analyst_branch(self, analyst_type, analyst_node, tool_node):
+        """Wrap one analyst's tool-calling loop as a subgraph with its own message channel.
+
+        The returned node starts the subgraph from a fresh conversation and writes
+        only the analyst's report back, so branches can run concurrently without
+        sharing or clearing the parent's messages. The tool-calling trace stays in
+        the subgraph state; stream with subgraphs=True to see it.
+        """
+        analyst_name = f"{analyst_type.capitalize()} Analyst"
+        tools_name = f"tools_{analyst_type}"
+        report_key = ANALYST_REPORT_KEYS[analyst_type]
+
+        branch = StateGraph(AgentState)
+        branch.add_node(analyst_name, analyst_node)
+        branch.add_node(tools_name, tool_node)
+        branch.add_edge(START, analyst_name)
+        branch.add_conditional_edges(
+            analyst_name,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {
+                tools_name: tools_name,
+                f"Msg Clear {analyst_type.capitalize()}": END,
+            },
+        )
+        branch.add_edge(tools_name, analyst_name)
+        # Checkpoints are kept per parent node, so a resumed run redoes a whole branch
+        branch = branch.compile(checkpointer=False)
+
+        def run_branch(state, config: RunnableConfig):
+            result = branch.invoke(
+                {
+                    "messages": [("human", state["company_of_interest"])],
+                    "company_of_interest": state["company_of_interest"],
+                    "trade_date": state["trade_date"],
+                },
+                config,
+            )
+            return {report_key: result[report_key]}
+
+        return run_branch
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=True,
+        checkpointer=None,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -51,6 +143,10 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run every analyst in its own branch from START,
+                joining before the Bull Researcher, instead of chaining them in order
+            checkpointer: LangGraph checkpointer saving the state after every node,
+                or None to run without checkpoints
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -88,24 +184,59 @@ class GraphSetup:
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
+        # Reuse reports of analysts whose inputs have not changed
+        if self.report_cache is not None:
+            factories = {
+                "market": create_market_analyst,
+                "social": create_social_media_analyst,
+                "news": create_news_analyst,
+                "fundamentals": create_fundamentals_analyst,
+            }
+            for analyst_type, node in analyst_nodes.items():
+                analyst_nodes[analyst_type] = self._cache_analyst(
+                    analyst_type, node, factories[analyst_type]
+                )
+
+        # Debaters see recent turns verbatim and a rolling summary of older ones
+        config = self.toolkit.config
+        debate_memory = DebateMemory(
+            self.quick_thinking_llm,
+            config["debate_recent_turns"],
+            config["debate_token_budget"],
+        )
+
+        # Prompts lead with what stays fixed within a run so providers can cache it
+        quick_layout = PromptLayout(
+            self.quick_thinking_llm, config["prompt_cache_markers"]
+        )
+        deep_layout = PromptLayout(self.deep_thinking_llm, config["prompt_cache_markers"])
+
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
+            self.quick_thinking_llm, self.bull_memory, debate_memory, quick_layout
         )
         bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
+            self.quick_thinking_llm, self.bear_memory, debate_memory, quick_layout
         )
         research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
+            self.deep_thinking_llm, self.invest_judge_memory, deep_layout
+        )
+        trader_node = create_trader(
+            self.quick_thinking_llm, self.trader_memory, quick_layout
         )
-        trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
 
         # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
+        risky_analyst = create_risky_debator(
+            self.quick_thinking_llm, debate_memory, quick_layout
+        )
+        neutral_analyst = create_neutral_debator(
+            self.quick_thinking_llm, debate_memory, quick_layout
+        )
+        safe_analyst = create_safe_debator(
+            self.quick_thinking_llm, debate_memory, quick_layout
+        )
         risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
+            self.deep_thinking_llm, self.risk_manager_memory, deep_layout
         )
 
         # Create workflow
@@ -113,6 +244,14 @@ class GraphSetup:
 
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
+            if parallel_analysts:
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    self._create_analyst_branch(
+                        analyst_type, node, tool_nodes[analyst_type]
+                    ),
+                )
+                continue
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
             workflow.add_node(
                 f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
@@ -130,30 +269,40 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
+        if parallel_analysts:
+            # Fan out to every analyst branch and join before the Bull Researcher
+            analyst_names = [
+                f"{analyst_type.capitalize()} Analyst"
+                for analyst_type in selected_analysts
+            ]
+            for analyst_name in analyst_names:
+                workflow.add_edge(START, analyst_name)
+            workflow.add_edge(analyst_names, "Bull Researcher")
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -202,4 +351,4 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
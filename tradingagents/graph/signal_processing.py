@@ -1,7 +1,24 @@
 # TradingAgents/graph/signal_processing.py
 
+import json
+import re
+import threading
+from typing import Dict, Optional, Set
+
 from langchain_openai import ChatOpenAI
 
+# Trailing block the risk judge is asked to end its decision with, also when the
+# label is set in markdown bold or italics (e.g. "**FINAL DECISION:** {...}")
+DECISION_BLOCK_PATTERN = re.compile(
+    r"FINAL DECISION[*_]*:[*_]*\s*(\{.*?\})", re.DOTALL
+)
+
+
+def ticker_symbols(ticker: str) -> Set[str]:
+    """Symbols a decision on ticker may trade: the ticker, or a crypto pair's base."""
+    ticker = ticker.strip().upper()
+    return {ticker, ticker.replace("-USD", ""), re.sub(r"-USDT?$", "", ticker)}
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -9,17 +26,74 @@ class SignalProcessor:
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self._lock = threading.Lock()
+        self.signals = 0
+        self.llm_fallbacks = 0
+
+    @staticmethod
+    def parse_decision_block(full_signal: str, ticker: Optional[str] = None) -> Optional[str]:
+        """
+        Read the decision from the signal's FINAL DECISION block.
+
+        Returns None when the block is missing, malformed, incomplete, trades
+        another symbol than ticker (when given) or when several blocks disagree.
+        """
+        symbols = ticker_symbols(ticker) if ticker else None
+        decisions = set()
+        for block in DECISION_BLOCK_PATTERN.findall(full_signal):
+            try:
+                fields = json.loads(block)
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(fields, dict):
+                return None
+
+            action = str(fields.get("action", "")).strip().upper()
+            if action == "HOLD":
+                decisions.add("HOLD")
+                continue
+            if action not in ("BUY", "SELL"):
+                return None
+
+            quantity = fields.get("quantity")
+            symbol = str(fields.get("symbol") or "").strip().upper()
+            if (
+                isinstance(quantity, bool)
+                or not isinstance(quantity, (int, float))
+                or quantity <= 0
+                or not re.fullmatch(r"[A-Z-]+", symbol)
+                or (symbols is not None and symbol not in symbols)
+            ):
+                return None
+            amount = f"{quantity:.8f}".rstrip("0").rstrip(".")
+            decisions.add(f"{action} {amount} {symbol}")
+
+        if len(decisions) != 1:
+            return None
+        return decisions.pop()
 
-    def process_signal(self, full_signal: str) -> str:
+    def process_signal(self, full_signal: str, ticker: Optional[str] = None) -> str:
         """
         Process a full trading signal to extract the core decision with quantities.
 
+        The decision block is parsed directly; the LLM is only asked when it is
+        missing, ambiguous or about another symbol than ticker.
+
         Args:
             full_signal: Complete trading signal text
+            ticker: Ticker the signal was produced for, if known
 
         Returns:
             Extracted decision (e.g., "BUY 0.05 BTC", "SELL 10 NVDA", "HOLD")
         """
+        decision = self.parse_decision_block(full_signal, ticker)
+        with self._lock:
+            self.signals += 1
+            if decision is None:
+                self.llm_fallbacks += 1
+        if decision is not None:
+            return decision
+
         messages = [
             (
                 "system",
@@ -27,7 +101,7 @@ class SignalProcessor:
 
 Extract the decision in one of these formats:
 - "BUY X.XXX SYMBOL" (for purchases with specific amounts)
-- "SELL X.XXX SYMBOL" (for sales with specific amounts)  
+- "SELL X.XXX SYMBOL" (for sales with specific amounts)
 - "HOLD" (for maintaining current position)
 
 Examples:
@@ -42,3 +116,12 @@ If no specific quantity is mentioned, extract just the action (BUY, SELL, or HOL
         ]
 
         return self.quick_thinking_llm.invoke(messages).content
+
+    def stats(self) -> Dict[str, float]:
+        """Get how many signals were processed and how often the LLM fallback ran."""
+        with self._lock:
+            return {
+                "signals": self.signals,
+                "llm_fallbacks": self.llm_fallbacks,
+                "fallback_rate": self.llm_fallbacks / self.signals if self.signals else 0.0,
+            }
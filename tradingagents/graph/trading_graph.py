@@ -1,6 +1,9 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import date
@@ -20,11 +23,14 @@ from tradingagents.agents.utils.agent_states import (
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.interface import get_config, prefetch_data, set_config
 
+from .checkpointer import get_checkpointer, run_thread_id
+from .llm_cache import get_llm_cache
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
 from .propagation import Propagator
+from .report_cache import get_report_cache
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
 from ..agents.utils.trade_executor import TradeExecutor
@@ -48,6 +54,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = selected_analysts
 
         # Update the interface's config
         set_config(self.config)
@@ -58,16 +65,26 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
+        # Replay identical LLM calls from the response cache
+        self.llm_cache = (
+            get_llm_cache(
+                os.path.join(self.config["data_cache_dir"], "llm_cache.sqlite"),
+                self.config["llm_cache_max_mb"],
+            )
+            if self.config["llm_cache"]
+            else None
+        )
+
         # Initialize LLMs
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
         elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
+            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], cache=self.llm_cache)
         elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"], cache=self.llm_cache)
+            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"], cache=self.llm_cache)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
         
@@ -84,7 +101,11 @@ class TradingAgentsGraph:
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            self.config["max_debate_rounds"],
+            self.config["max_risk_discuss_rounds"],
+            self.config["debate_convergence_threshold"],
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
@@ -96,6 +117,7 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            get_report_cache() if self.config["analyst_report_cache"] else None,
         )
 
         self.propagator = Propagator()
@@ -106,9 +128,21 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self._log_states_by_ticker = {}  # ticker to its date to full state dict
+        self._settle_lock = threading.Lock()
+
+        # Checkpoint the state after every node so failed runs can resume (resume_runs)
+        # and finished ones can be partially re-run
+        self.checkpointer = (
+            get_checkpointer(self.config["checkpoint_db"])
+            if self.config["checkpoint_db"]
+            else None
+        )
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, self.config["parallel_analysts"], self.checkpointer
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -155,59 +189,279 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
-
-        self.ticker = company_name
+    def _prepare_run(self, company_name, trade_date, args, timings=None, wallet=None):
+        """Prefetch data and point args at the run's checkpoint thread; returns the graph input."""
+        # Warm the data caches in parallel before the analysts start calling tools
+        stage_start = time.perf_counter()
+        config = get_config()
+        if config["prefetch_data"]:
+            prefetch_report = prefetch_data(
+                company_name,
+                str(trade_date),
+                config["online_tools"],
+                config["prefetch_workers"],
+                self.selected_analysts,
+            )
+            if self.debug:
+                for task, status in prefetch_report.items():
+                    print(f"Prefetch {task}: {status}")
+        if timings is not None:
+            timings["prefetch"] = time.perf_counter() - stage_start
 
         # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
+        graph_input = self.propagator.create_initial_state(company_name, trade_date, wallet)
+
+        if self.checkpointer is not None:
+            thread_id = run_thread_id(company_name, str(trade_date))
+            args["config"]["configurable"] = {"thread_id": thread_id}
+            snapshot = self.graph.get_state(args["config"])
+            if snapshot.next and config["resume_runs"]:
+                # An earlier run failed part-way: resume after its last completed node
+                graph_input = None
+            elif snapshot.values:
+                # Start over rather than stacking a new run on an earlier one
+                self.checkpointer.delete_thread(thread_id)
+
+        return graph_input
+
+    def _run_graph(self, company_name, trade_date, timings=None, wallet=None):
+        """Prefetch data and run the graph for one (company, date); returns the final state.
+
+        If a timings dict is given, it is filled with seconds spent in the prefetch
+        stage and, per graph node, the wall-clock time up to that node's update.
+        """
         args = self.propagator.get_graph_args()
+        graph_input = self._prepare_run(company_name, trade_date, args, timings, wallet)
+        return self._execute(graph_input, args, timings)
+
+    def stream(self, company_name, trade_date):
+        """Run the graph for one (company, date), yielding output as it is produced.
+
+        Yields:
+            ("messages", (message_chunk, metadata)) for each LLM token delta, with
+            the emitting node in metadata["langgraph_node"];
+            ("updates", {node: update}) when a node finishes, holding only the
+            keys it wrote (nodes inside the analyst branches included); and
+            finally ("values", final_state) once.
+        """
+        args = self.propagator.get_stream_args()
+        graph_input = self._prepare_run(company_name, trade_date, args)
 
+        # Fold the updates into the state instead of streaming a copy per step
+        if graph_input is None:
+            final_state = dict(self.graph.get_state(args["config"]).values)
+        else:
+            final_state = dict(graph_input)
+        for namespace, mode, chunk in self.graph.stream(graph_input, **args):
+            if mode == "updates" and not namespace:
+                for update in chunk.values():
+                    if isinstance(update, dict):
+                        final_state.update(
+                            (key, value)
+                            for key, value in update.items()
+                            if key != "messages"
+                        )
+            yield mode, chunk
+
+        if self.checkpointer is not None:
+            final_state = self.graph.get_state(args["config"]).values
+        yield "values", final_state
+
+    def _execute(self, graph_input, args, timings=None):
+        """Run the compiled graph from graph_input (None resumes the configured checkpoint)."""
         if self.debug:
-            # Debug mode with tracing
+            # Debug mode with tracing; the analyst branches keep their tool-calling
+            # messages in their own subgraph state, so stream those too
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for namespace, chunk in self.graph.stream(
+                graph_input, subgraphs=True, **args
+            ):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
                     chunk["messages"][-1].pretty_print()
+                if not namespace:
                     trace.append(chunk)
 
             final_state = trace[-1]
+        elif timings is not None:
+            # Stream node updates alongside values to time each node
+            last_update = time.perf_counter()
+            for mode, chunk in self.graph.stream(
+                graph_input,
+                stream_mode=["updates", "values"],
+                config=args["config"],
+            ):
+                if mode == "values":
+                    final_state = chunk
+                    continue
+                now = time.perf_counter()
+                for node in chunk:
+                    key = f"node:{node}"
+                    timings[key] = timings.get(key, 0.0) + now - last_update
+                last_update = now
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            final_state = self.graph.invoke(graph_input, **args)
 
-        # Store current state for reflection
-        self.curr_state = final_state
+        return final_state
 
-        # Log state
-        self._log_state(trade_date, final_state)
+    def _settle(self, company_name, trade_date, final_state):
+        """Log the state, process the signal and execute the trade for a finished run."""
+        with self._settle_lock:
+            self.ticker = company_name
 
-        # Process the trading decision
-        processed_decision = self.process_signal(final_state["final_trade_decision"])
-        
-        # Execute the trade
-        trade_executor = TradeExecutor(final_state["wallet"])
-        trade_success, trade_message = trade_executor.execute_trade(processed_decision, trade_date)
-        
-        # Create comprehensive result
-        result = {
-            "decision": processed_decision,
-            "trade_executed": trade_success,
-            "trade_message": trade_message,
-            "wallet_summary": final_state["wallet"].get_portfolio_summary(),
-            "full_analysis": final_state["final_trade_decision"]
-        }
+            # Store current state for reflection
+            self.curr_state = final_state
+
+            # Log state
+            self._log_state(trade_date, final_state)
+
+            # Process the trading decision
+            processed_decision = self.process_signal(
+                final_state["final_trade_decision"], company_name
+            )
+
+            # Execute the trade against the latest saved wallet, which other runs may have changed
+            final_state["wallet"].load_wallet()
+            trade_executor = TradeExecutor(final_state["wallet"])
+            trade_success, trade_message = trade_executor.execute_trade(processed_decision, trade_date)
+
+            # Create comprehensive result
+            result = {
+                "decision": processed_decision,
+                "trade_executed": trade_success,
+                "trade_message": trade_message,
+                "wallet_summary": final_state["wallet"].get_portfolio_summary(),
+                "full_analysis": final_state["final_trade_decision"],
+                "turns_saved": self.conditional_logic.turns_saved(final_state),
+            }
+
+            return result
+
+    def propagate(self, company_name, trade_date):
+        """Run the trading agents graph for a company on a specific date."""
+        final_state = self._run_graph(company_name, trade_date)
+        result = self._settle(company_name, trade_date, final_state)
 
         # Return decision and comprehensive result
         return final_state, result
 
+    def analyze(self, company_name, trade_date, wallet=None, timings=None):
+        """Run the graph for one (company, date) and extract its decision without trading.
+
+        Nothing is executed against the wallet, so the decision can be scored or
+        replayed offline, e.g. by the Backtester.
+
+        Args:
+            company_name: Ticker to analyze
+            trade_date: Date to trade at
+            wallet: Wallet the agents are shown, e.g. TradingWallet(wallet_file=None)
+                to keep the run off the saved wallet; defaults to the saved wallet
+            timings: Optional dict filled with seconds per stage, as in _run_graph
+
+        Returns:
+            (final_state, decision), the decision as extracted by process_signal
+        """
+        final_state = self._run_graph(company_name, trade_date, timings, wallet)
+        with self._settle_lock:
+            self.ticker = company_name
+            self.curr_state = final_state
+            self._log_state(trade_date, final_state)
+
+        return final_state, self.process_signal(
+            final_state["final_trade_decision"], company_name
+        )
+
+    def _stage_snapshot(self, company_name, trade_date, node):
+        """Get the checkpoint at which node first runs in the (company, date) run."""
+        if self.checkpointer is None:
+            raise ValueError("Checkpointing is disabled: set checkpoint_db in the config")
+        thread_config = {
+            "configurable": {"thread_id": run_thread_id(company_name, str(trade_date))}
+        }
+        if node is None:
+            return self.graph.get_state(thread_config)
+
+        stage_snapshot = None
+        # History is newest first; keep the earliest so debate loops rerun in full
+        for snapshot in self.graph.get_state_history(thread_config):
+            if node in snapshot.next:
+                stage_snapshot = snapshot
+        if stage_snapshot is None:
+            raise ValueError(
+                f"No checkpoint before {node} for {company_name} on {trade_date}"
+            )
+        return stage_snapshot
+
+    def load_state(self, company_name, trade_date, node=None):
+        """Load a checkpointed state of the (company, date) run.
+
+        Args:
+            company_name: Ticker of the run
+            trade_date: Date of the run
+            node: Return the state every stage upstream of this node had produced
+                when it first ran (e.g. "Risky Analyst"); None for the latest state
+        """
+        return self._stage_snapshot(company_name, trade_date, node).values
+
+    def propagate_from(self, company_name, trade_date, node):
+        """Re-run a checkpointed (company, date) run from node onwards.
+
+        Stages upstream of node are loaded from the checkpoint rather than re-run,
+        so e.g. the risk debate can be repeated with a different deep_think_llm by
+        a graph built with another config sharing the same checkpoint_db.
+        """
+        snapshot = self._stage_snapshot(company_name, trade_date, node)
+        args = self.propagator.get_graph_args()
+        args["config"]["configurable"] = snapshot.config["configurable"]
+
+        final_state = self._execute(None, args)
+        result = self._settle(company_name, trade_date, final_state)
+
+        return final_state, result
+
+    def propagate_many(self, company_names, trade_date, max_workers=None):
+        """Run the graph for many companies on one date, concurrently.
+
+        Runs share this graph's LLM clients, the process-wide data caches, and
+        ticker-independent results such as the day's global news. Trades are
+        settled one at a time against the shared wallet.
+
+        Args:
+            company_names: Tickers to analyze
+            trade_date: Date to trade at
+            max_workers: Number of concurrent runs (defaults to propagate_workers)
+
+        Yields:
+            (company_name, final_state, result) as each run finishes. A failed run
+            yields final_state None and a result with an "error" message. Runs
+            settle in completion order, so curr_state ends up holding whichever
+            finished last; pass each final_state to reflect_and_remember instead.
+        """
+        max_workers = max_workers or get_config()["propagate_workers"]
+
+        def run(company_name):
+            final_state = self._run_graph(company_name, trade_date)
+            return final_state, self._settle(company_name, trade_date, final_state)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(run, company_name): company_name
+                for company_name in company_names
+            }
+            for future in as_completed(futures):
+                company_name = futures[future]
+                try:
+                    final_state, result = future.result()
+                except Exception as e:
+                    yield company_name, None, {"error": f"{type(e).__name__}: {e}"}
+                else:
+                    yield company_name, final_state, result
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
+        self.log_states_dict = self._log_states_by_ticker.setdefault(self.ticker, {})
         self.log_states_dict[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
@@ -236,6 +490,7 @@ class TradingAgentsGraph:
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
+            "turns_saved": self.conditional_logic.turns_saved(final_state),
         }
 
         # Save to file
@@ -248,24 +503,31 @@ class TradingAgentsGraph:
         ) as f:
             json.dump(self.log_states_dict, f, indent=4)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+    def reflect_and_remember(self, returns_losses, state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        Args:
+            returns_losses: Position returns of the run being reflected on
+            state: Final state of that run, e.g. one yielded by propagate_many;
+                defaults to the state of the last run settled
+        """
+        state = self.curr_state if state is None else state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            state, returns_losses, self.risk_manager_memory
         )
 
-    def process_signal(self, full_signal):
-        """Process a signal to extract the core decision."""
-        return self.signal_processor.process_signal(full_signal)
+    def process_signal(self, full_signal, ticker=None):
+        """Process a signal to extract the core decision, checked against ticker if given."""
+        return self.signal_processor.process_signal(full_signal, ticker)